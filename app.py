@@ -4,9 +4,18 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_jwt_extended import JWTManager
 from dotenv import load_dotenv
 from models import db, init_db
+from compression import init_compression
+from jwt_keys import init_jwt_keys
+from circuit_breaker import init_circuit_breakers, breaker_status
+from group_commit import GroupCommitWriter
+from post_stats import PostStats
+from latest_feed import LatestFeed
+from seed import seed_command
+from swagger_docs import init_swagger
+from idempotency import init_idempotency
+from rate_limit import init_rate_limiter
 from flask_jwt_extended import JWTManager, create_access_token, jwt_required, get_jwt_identity
 from flask_cors import CORS
-from flasgger import Swagger
 
 from routes.kakao_auth import kakao_auth
 from routes.posts import posts
@@ -36,11 +45,25 @@ swagger_template = {
     ]
 }
 
-swagger = Swagger(app, template=swagger_template)
+# ✅ Swagger 문서 (운영 환경에서는 SWAGGER_ENABLED=0 또는 `flask swagger-spec`으로 미리 생성한 스펙 파일 사용)
+app.config["SWAGGER_ENABLED"] = os.getenv("SWAGGER_ENABLED", "1") == "1"
+app.config["SWAGGER_SPEC_PATH"] = os.getenv("SWAGGER_SPEC_PATH")
+swagger = init_swagger(app, swagger_template)
 
 app.secret_key = os.getenv("FLASK_SECRET_KEY")
 app.config["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY", "supersecretkey")
 
+# ✅ 비대칭 JWT 서명 설정 (RS256 / EdDSA 사용 시 /.well-known/jwks.json 으로 공개키 제공)
+app.config["JWT_ALGORITHM"] = os.getenv("JWT_ALGORITHM", "HS256")
+app.config["JWT_KEYS_DIR"] = os.getenv("JWT_KEYS_DIR")              # <kid>.pem 파일 디렉토리
+app.config["JWT_ACTIVE_KID"] = os.getenv("JWT_ACTIVE_KID")          # 서명에 사용할 kid (미지정 시 마지막 키)
+app.config["JWT_LEGACY_HS256"] = os.getenv("JWT_LEGACY_HS256") == "1"  # 교체 기간 동안 기존 HS256 토큰 허용
+app.config["JWT_DEV_EPHEMERAL_KEY"] = os.getenv("JWT_DEV_EPHEMERAL_KEY") == "1"  # 개발용: 키가 없으면 임시 키 생성
+app.config["JWKS_MAX_AGE"] = int(os.getenv("JWKS_MAX_AGE", "3600"))
+app.config["INTROSPECT_API_KEY"] = os.getenv("INTROSPECT_API_KEY")        # /auth/introspect 내부 서비스 인증 키 (없으면 비활성화)
+app.config["INTROSPECT_ALLOW_PUBLIC"] = os.getenv("INTROSPECT_ALLOW_PUBLIC") == "1"  # 키 없이 허용 (로컬 개발용)
+app.config["INTROSPECT_MAX_TOKENS"] = int(os.getenv("INTROSPECT_MAX_TOKENS", "100"))
+
 # ✅ Supabase PostgreSQL 데이터베이스 설정
 #app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("SUPABASE_DB_URL")
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
@@ -50,15 +73,69 @@ app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
     "pool_recycle": 1800,   # ⏳ 30분마다 연결을 새로고침
 }
 
+# ✅ 응답 압축 설정 (gzip / brotli)
+app.config["COMPRESS_MIN_SIZE"] = int(os.getenv("COMPRESS_MIN_SIZE", "500"))
+app.config["COMPRESS_LEVEL"] = int(os.getenv("COMPRESS_LEVEL", "6"))
+app.config["COMPRESS_BR_QUALITY"] = int(os.getenv("COMPRESS_BR_QUALITY", "6"))  # gzip-6과 비슷한 크기, 더 적은 CPU (bench/compression_bench.py)
+init_compression(app)
+init_circuit_breakers(app)
+
+# ✅ Idempotency-Key 저장소 (memory: 워커별 / filesystem: 같은 서버 공유 / redis: 여러 서버 공유)
+app.config["IDEMPOTENCY_BACKEND"] = os.getenv("IDEMPOTENCY_BACKEND", "memory")
+app.config["IDEMPOTENCY_REDIS_URL"] = os.getenv("IDEMPOTENCY_REDIS_URL")
+app.config["IDEMPOTENCY_MAX_KEYS"] = int(os.getenv("IDEMPOTENCY_MAX_KEYS", "10000"))
+app.config["IDEMPOTENCY_TTL"] = int(os.getenv("IDEMPOTENCY_TTL", "86400"))
+init_idempotency(app)
+
+# ✅ 토큰 버킷 요청 제한 (blueprint별 IP / 사용자 한도, RATE_LIMIT_<BLUEPRINT>_<IP|USER>=30/minute 형식으로 조정)
+app.config["RATE_LIMIT_ENABLED"] = os.getenv("RATE_LIMIT_ENABLED", "1") == "1"
+app.config["RATE_LIMIT_BACKEND"] = os.getenv("RATE_LIMIT_BACKEND", "memory")   # memory / redis
+app.config["RATE_LIMIT_REDIS_URL"] = os.getenv("RATE_LIMIT_REDIS_URL")
+app.config["RATE_LIMIT_TRUST_PROXY"] = os.getenv("RATE_LIMIT_TRUST_PROXY") == "1"  # X-Forwarded-For 사용 (프록시 뒤 배포 시)
+app.config["RATE_LIMITS"] = {
+    "kakao_auth": {"ip": "20/minute"},
+    "naver_auth": {"ip": "20/minute"},
+    "google_auth": {"ip": "20/minute"},
+    "posts": {"user": "10/minute", "ip": "30/minute"},
+    "comments": {"user": "30/minute", "ip": "60/minute"},
+}
+init_rate_limiter(app)
+
 
 # ✅ DB 및 JWT 초기화
 db = SQLAlchemy()
 jwt = JWTManager(app)
+init_jwt_keys(app, jwt)
 
 # ✅ 모델 import 후 초기화
-from models import db, User, Post, init_db
+from models import db, User, Post, Comment, init_db
 init_db(app)
 
+# ✅ 댓글 그룹 커밋 (옵션): 동시 요청의 댓글 INSERT를 모아 한 번에 커밋
+if os.getenv("COMMENT_GROUP_COMMIT") == "1":
+    app.extensions["comment_writer"] = GroupCommitWriter(
+        app, db, Comment,
+        flush_interval=float(os.getenv("COMMENT_FLUSH_INTERVAL_MS", "5")) / 1000,
+        max_batch=int(os.getenv("COMMENT_MAX_BATCH", "500")),
+    )
+
+# ✅ 조회수 버퍼링 + 인기 게시글 순위 (워커별 백그라운드 스레드)
+app.extensions["post_stats"] = PostStats(
+    app,
+    flush_interval=float(os.getenv("VIEW_FLUSH_INTERVAL", "10")),
+    refresh_interval=float(os.getenv("HOT_REFRESH_INTERVAL", "30")),
+    size=int(os.getenv("HOT_POSTS_SIZE", "50")),
+    window_hours=float(os.getenv("HOT_WINDOW_HOURS", "72")),
+)
+
+# ✅ 최신 게시글 첫 페이지 메모리 캐시 (워커 간 변경은 신호 파일로 전달)
+app.extensions["latest_feed"] = LatestFeed(
+    app,
+    size=int(os.getenv("LATEST_FEED_SIZE", "50")),
+    signal_path=os.getenv("LATEST_FEED_SIGNAL_PATH"),
+    max_age=float(os.getenv("LATEST_FEED_MAX_AGE", "60")),
+)
+
 # ✅ Flask 컨텍스트에서 DB 생성
 with app.app_context():
     print("🚀 데이터베이스 테이블 생성 시작...")
@@ -78,6 +155,9 @@ app.register_blueprint(comments)
 app.register_blueprint(naver_auth)
 app.register_blueprint(auth)
 
+# ✅ CLI 명령 등록 (flask seed)
+app.cli.add_command(seed_command)
+
 # ✅ 사용자 정보 확인 (JWT 필요)
 @app.route("/profile", methods=["GET"])
 @jwt_required()
@@ -135,7 +215,8 @@ def logout():
 
 @app.route("/health")
 def health_check():
-    return "OK", 200
+    # 외부 로그인 제공자 장애는 서비스 자체 장애가 아니므로 200 유지, 상태만 노출
+    return jsonify({"status": "OK", "oauth_providers": breaker_status()}), 200
 
 
 # 서버 실행
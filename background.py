@@ -0,0 +1,23 @@
+import threading
+
+
+class LazyThread:
+    """
+    처음 사용할 때 시작하는 daemon 백그라운드 스레드
+    gunicorn fork 이후에는 부모 프로세스의 스레드가 따라오지 않으므로,
+    워커 프로세스에서 ensure_started()가 처음 호출될 때 시작하고 스레드가 멈췄으면 다시 시작합니다.
+    """
+
+    def __init__(self, target, name):
+        self.target = target
+        self.name = name
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self.target, name=self.name, daemon=True)
+                self._thread.start()
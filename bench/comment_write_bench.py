@@ -0,0 +1,78 @@
+"""
+댓글 쓰기 경로 처리량 비교: 요청당 커밋 vs 그룹 커밋(GroupCommitWriter)
+
+사용법: python bench/comment_write_bench.py [스레드 수] [스레드당 댓글 수]
+BENCH_DB_URL 환경 변수로 DB 지정 (기본: 임시 SQLite 파일)
+"""
+import os
+import sys
+import time
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from models import db, init_db, User, Post, Comment, comment_path_segment
+from group_commit import GroupCommitWriter
+
+
+def make_app():
+    app = Flask(__name__)
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("BENCH_DB_URL", f"sqlite:///{db_path}")
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {"pool_size": 20} if os.getenv("BENCH_DB_URL") else {}
+    init_db(app)
+    with app.app_context():
+        db.create_all()
+        user = User(provider="bench", social_id="bench", name="bench", email="bench@example.com")
+        db.session.add(user)
+        db.session.flush()
+        post = Post(title="bench", content="bench", user_id=user.id)
+        db.session.add(post)
+        db.session.commit()
+        return app, user.id, post.id
+
+
+def direct_insert(app, user_id, post_id):
+    with app.app_context():
+        db.session.add(Comment(post_id=post_id, user_id=user_id, content="댓글 벤치마크", path=comment_path_segment(), depth=0))
+        db.session.commit()
+
+
+def run(name, fn, threads, per_thread):
+    total = threads * per_thread
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda _: fn(), range(total)))
+    elapsed = time.perf_counter() - start
+    print(f"{name:<14} {total:>7}건  {elapsed:7.2f}s  {total / elapsed:9.1f} rows/s")
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    per_thread = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    app, user_id, post_id = make_app()
+    # SQLite는 쓰기가 직렬화되므로 요청당 커밋도 잠금 경합 없이 비교하도록 락으로 감쌈
+    lock = threading.Lock() if app.config["SQLALCHEMY_DATABASE_URI"].startswith("sqlite") else None
+
+    def direct():
+        if lock:
+            with lock:
+                direct_insert(app, user_id, post_id)
+        else:
+            direct_insert(app, user_id, post_id)
+
+    writer = GroupCommitWriter(app, db, Comment)
+
+    def grouped():
+        writer.submit(post_id=post_id, user_id=user_id, content="댓글 벤치마크", path=comment_path_segment(), depth=0)
+
+    run("per-request", direct, threads, per_thread)
+    run("group-commit", grouped, threads, per_thread)
+
+
+if __name__ == "__main__":
+    main()
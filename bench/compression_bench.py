@@ -0,0 +1,60 @@
+"""
+게시글 목록 JSON 기준 압축 레벨별 압축률 / CPU 비용 측정
+
+사용법: python bench/compression_bench.py [게시글 수]
+"""
+import gzip
+import json
+import random
+import sys
+import time
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def make_listing(count):
+    """/posts 응답과 같은 형태의 게시글 목록 생성"""
+    words = ["바나나", "커뮤니티", "게시글", "댓글", "flask", "supabase", "로그인", "이미지", "오늘", "내일"]
+    return json.dumps([
+        {
+            "id": i,
+            "title": " ".join(random.choices(words, k=5)),
+            "content": " ".join(random.choices(words, k=60)),
+            "image_url": f"https://example.supabase.co/storage/v1/object/public/images/posts/{i}_1700000000.0_img.png",
+            "created_at": "Mon, 01 Jan 2024 00:00:00 GMT",
+            "author": f"user{i % 50}",
+        }
+        for i in range(count)
+    ]).encode()
+
+
+def measure(name, fn, data, rounds=20):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        out = fn(data)
+    elapsed = (time.perf_counter() - start) / rounds
+    ratio = len(out) / len(data)
+    print(f"{name:<12} {len(out):>10} B  ratio={ratio:6.3f}  {elapsed * 1000:8.2f} ms  {len(data) / elapsed / 1e6:8.1f} MB/s")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    random.seed(0)
+    data = make_listing(count)
+    print(f"원본 크기: {len(data)} B ({count}개 게시글)")
+
+    for level in range(1, 10):
+        measure(f"gzip-{level}", lambda d, lv=level: gzip.compress(d, compresslevel=lv, mtime=0), data)
+
+    if brotli is None:
+        print("brotli 미설치 → br 측정 생략")
+        return
+    for quality in (1, 4, 5, 6, 7, 9, 11):
+        measure(f"br-{quality}", lambda d, q=quality: brotli.compress(d, quality=q), data)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+메모리 토큰 버킷(MemoryBuckets.consume) 호출 비용 측정
+
+사용법: python bench/rate_limit_bench.py [활성 키 수] [호출 횟수]
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rate_limit import MemoryBuckets, parse_limit
+
+
+def main():
+    keys = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    calls = int(sys.argv[2]) if len(sys.argv) > 2 else 500000
+    rate, burst = parse_limit("1000/second")  # 허용 경로 측정을 위해 넉넉한 한도
+    key_names = [f"posts:ip:10.0.{i // 256}.{i % 256}" for i in range(keys)]
+    picks = [random.choice(key_names) for _ in range(calls)]
+
+    buckets = MemoryBuckets(max_keys=keys * 2)
+    start = time.perf_counter()
+    for key in picks:
+        buckets.consume(key, rate, burst)
+    elapsed = time.perf_counter() - start
+    print(f"활성 키 {keys}개, {calls}회 호출: {elapsed / calls * 1e9:.0f} ns/call, 보관 키 {len(buckets._buckets)}개")
+
+    # 키 수 상한 동작 확인 (상한을 넘으면 가장 오래 쓰이지 않은 키부터 제거)
+    small = MemoryBuckets(max_keys=keys // 10)
+    for key in picks:
+        small.consume(key, rate, burst)
+    print(f"max_keys={keys // 10}: 보관 키 {len(small._buckets)}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+벤치마크용 외부 서비스 스텁 (Kakao / Naver / Google OAuth, Supabase Storage)
+
+인가 코드(code)를 그대로 사용자 식별자로 사용하므로
+같은 code로 로그인하면 항상 같은 사용자가 됩니다.
+"""
+import threading
+from flask import Flask, request, jsonify
+from werkzeug.serving import make_server
+
+
+def _bearer_subject(prefix):
+    token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+    return token.removeprefix(prefix)
+
+
+def create_stub_app():
+    stub = Flask("bench_stubs")
+
+    # ✅ Kakao
+    @stub.route("/kakao/token", methods=["POST"])
+    def kakao_token():
+        return jsonify({"access_token": "kakao-" + request.form["code"], "token_type": "bearer"})
+
+    @stub.route("/kakao/user", methods=["GET"])
+    def kakao_user():
+        subject = _bearer_subject("kakao-")
+        return jsonify({
+            "id": f"k{subject}",
+            "kakao_account": {"email": f"{subject}@kakao.bench", "profile": {"nickname": f"kakao {subject}"}},
+        })
+
+    # ✅ Naver
+    @stub.route("/naver/token", methods=["POST"])
+    def naver_token():
+        return jsonify({"access_token": "naver-" + request.form["code"], "token_type": "bearer"})
+
+    @stub.route("/naver/user", methods=["GET"])
+    def naver_user():
+        subject = _bearer_subject("naver-")
+        return jsonify({"resultcode": "00", "response": {
+            "id": f"n{subject}", "name": f"naver {subject}", "email": f"{subject}@naver.bench",
+        }})
+
+    # ✅ Google
+    @stub.route("/google/token", methods=["POST"])
+    def google_token():
+        return jsonify({"access_token": "google-" + request.form["code"], "token_type": "Bearer"})
+
+    @stub.route("/google/user", methods=["GET"])
+    def google_user():
+        subject = _bearer_subject("google-")
+        return jsonify({"id": f"g{subject}", "name": f"google {subject}", "email": f"{subject}@google.bench"})
+
+    # ✅ Supabase Storage 업로드
+    @stub.route("/storage/v1/object/<bucket>/<path:path>", methods=["POST", "PUT"])
+    def storage_upload(bucket, path):
+        request.get_data()
+        return jsonify({"Key": f"{bucket}/{path}", "Id": path})
+
+    return stub
+
+
+class StubServer:
+    """스텁 앱을 백그라운드 스레드에서 실행"""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self._server = make_server(host, port, create_stub_app(), threaded=True)
+        self.url = f"http://{host}:{self._server.server_port}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
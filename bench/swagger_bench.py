@@ -0,0 +1,82 @@
+"""
+Swagger 설정별 앱 시작 시간 / /apispec_1.json 응답 비용 측정
+
+사용법: python bench/swagger_bench.py [반복 횟수]
+각 설정은 새 프로세스에서 app.py를 import 하여 측정합니다.
+"""
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r"""
+import os, sys, json, time, contextlib
+sys.path.insert(0, os.environ["BENCH_ROOT"])
+sys.path.insert(0, os.path.join(os.environ["BENCH_ROOT"], "bench"))
+from e2e_bench import configure_env
+configure_env("http://127.0.0.1:1", os.environ["BENCH_DB_URL"])
+os.chdir(os.environ["BENCH_ROOT"])
+
+with contextlib.redirect_stdout(sys.stderr):
+    start = time.perf_counter()
+    from app import app
+    import_ms = (time.perf_counter() - start) * 1000
+
+    client = app.test_client()
+    start = time.perf_counter()
+    status = client.get("/apispec_1.json").status_code
+    first_ms = (time.perf_counter() - start) * 1000
+
+    rounds = int(os.environ["BENCH_ROUNDS"])
+    start = time.perf_counter()
+    for _ in range(rounds):
+        client.get("/apispec_1.json")
+    warm_ms = (time.perf_counter() - start) * 1000 / rounds
+
+print(json.dumps({"import_ms": import_ms, "first_ms": first_ms, "warm_ms": warm_ms, "status": status}))
+"""
+
+
+def probe(extra_env, rounds):
+    env = dict(os.environ, BENCH_ROOT=ROOT, BENCH_ROUNDS=str(rounds),
+               BENCH_DB_URL=f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}", **extra_env)
+    out = subprocess.run([sys.executable, "-c", PROBE], env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    spec_path = os.path.join(tempfile.mkdtemp(), "apispec.json")
+    subprocess.run([sys.executable, "-m", "flask", "--app", "app", "swagger-spec", "--output", spec_path],
+                   cwd=ROOT, env=dict(os.environ, **_bench_env()), capture_output=True)
+
+    configs = [
+        ("flasgger (runtime spec)", {"SWAGGER_ENABLED": "1"}),
+        ("flasgger + spec file", {"SWAGGER_ENABLED": "1", "SWAGGER_SPEC_PATH": spec_path}),
+        ("spec file only", {"SWAGGER_ENABLED": "0", "SWAGGER_SPEC_PATH": spec_path}),
+        ("disabled", {"SWAGGER_ENABLED": "0"}),
+    ]
+    print(f"{'설정':<26} {'import':>10} {'첫 요청':>10} {'이후 요청':>10}  status")
+    for name, env in configs:
+        r = probe(env, rounds)
+        print(f"{name:<26} {r['import_ms']:>8.1f}ms {r['first_ms']:>8.2f}ms {r['warm_ms']:>8.3f}ms  {r['status']}")
+
+
+def _bench_env():
+    sys.path.insert(0, ROOT)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from e2e_bench import configure_env
+
+    saved = dict(os.environ)
+    configure_env("http://127.0.0.1:1", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+    env = dict(os.environ)
+    os.environ.clear()
+    os.environ.update(saved)
+    return env
+
+
+if __name__ == "__main__":
+    main()
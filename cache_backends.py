@@ -0,0 +1,72 @@
+import os
+import fcntl
+import tempfile
+import threading
+from cachelib import SimpleCache, FileSystemCache, RedisCache
+
+
+class MemoryCache(SimpleCache):
+    """add가 스레드 간 원자적이고, 만료된 채 남아 있는 항목은 없는 것으로 보는 SimpleCache"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+
+    def add(self, key, value, timeout=None):
+        with self._lock:
+            if self.has(key):
+                return False
+            return self.set(key, value, timeout=timeout)
+
+
+class LockedFileSystemCache(FileSystemCache):
+    """
+    add를 프로세스 간 원자적으로 처리하는 FileSystemCache
+    (기본 add는 exists → set 이라 두 워커가 같은 키를 동시에 얻을 수 있음)
+    flock 잠금은 프로세스가 죽으면 자동으로 풀리므로 잠금 파일이 남아도 문제없음
+    """
+
+    def __init__(self, cache_dir, *args, **kwargs):
+        super().__init__(cache_dir, *args, **kwargs)
+        self._lock_path = cache_dir.rstrip(os.sep) + ".lock"
+
+    def add(self, key, value, timeout=None):
+        with open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                if self.has(key):  # 만료된 파일은 없는 것으로 보고 덮어씀
+                    return False
+                return self.set(key, value, timeout=timeout)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class AtomicRedisCache(RedisCache):
+    """SETNX와 EXPIRE 사이에 프로세스가 죽어 만료 없는 키가 남지 않도록 SET NX EX 한 번으로 add"""
+
+    def add(self, key, value, timeout=None):
+        timeout = self._normalize_timeout(timeout)
+        return bool(self._write_client.set(
+            name=f"{self._get_prefix()}{key}",
+            value=self.serializer.dumps(value),
+            nx=True,
+            ex=timeout if timeout > 0 else None,
+        ))
+
+
+def make_cache(name, backend="memory", threshold=10000, default_timeout=300, redis_url=None):
+    """
+    공유 저장소 생성 (cachelib 인터페이스, add는 모든 백엔드에서 원자적인 set-if-absent)
+    - memory: 워커별 메모리 (threshold 초과 시 만료/오래된 항목부터 제거)
+    - filesystem: 같은 서버의 워커들이 공유
+    - redis: 여러 서버가 공유 (redis 패키지 필요)
+    """
+    if backend == "memory":
+        return MemoryCache(threshold=threshold, default_timeout=default_timeout)
+    if backend == "filesystem":
+        cache_dir = os.path.join(tempfile.gettempdir(), f"banana-{name}")
+        return LockedFileSystemCache(cache_dir, threshold=threshold, default_timeout=default_timeout)
+    if backend == "redis":
+        import redis
+        return AtomicRedisCache(redis.from_url(redis_url), default_timeout=default_timeout, key_prefix=f"{name}:")
+    raise ValueError(f"지원하지 않는 캐시 백엔드: {backend}")
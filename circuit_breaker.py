@@ -0,0 +1,143 @@
+import os
+import time
+import threading
+import requests
+
+
+class CircuitOpenError(Exception):
+    """차단기가 열려 있거나 동시 호출 한도를 넘어 외부 호출을 하지 않은 경우"""
+
+    def __init__(self, name, message, retry_after=None):
+        super().__init__(message)
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    외부 OAuth 제공자 호출용 서킷 브레이커
+    - closed: 정상 호출, 연속 실패가 failure_threshold 이상이면 open
+    - open: recovery_timeout 동안 즉시 실패
+    - half_open: 한 건만 시험 호출, 성공하면 closed / 실패하면 다시 open
+    - max_concurrent: 제공자별 동시 호출 수 제한 (느린 제공자가 워커를 모두 점유하지 않도록)
+    """
+
+    def __init__(self, name, timeout=5.0, failure_threshold=5, recovery_timeout=30.0, max_concurrent=10):
+        self.name = name
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.max_concurrent = max_concurrent
+
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.in_flight = 0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def _acquire(self):
+        with self._lock:
+            if self.state == "open":
+                remaining = self.opened_at + self.recovery_timeout - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(self.name, f"{self.name} 서버 응답 불가 (차단기 열림)", retry_after=remaining)
+                self.state = "half_open"
+
+            if self.in_flight >= self.max_concurrent:
+                raise CircuitOpenError(self.name, f"{self.name} 동시 요청 한도 초과", retry_after=1)
+
+            is_probe = False
+            if self.state == "half_open":
+                if self._probing:
+                    raise CircuitOpenError(self.name, f"{self.name} 서버 상태 확인 중", retry_after=self.timeout)
+                self._probing = is_probe = True
+
+            self.in_flight += 1
+            return is_probe
+
+    def _release(self, success, is_probe):
+        with self._lock:
+            self.in_flight -= 1
+            if is_probe:
+                self._probing = False
+            if success:
+                self.state = "closed"
+                self.failures = 0
+                return
+
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+    def request(self, method, url, **kwargs):
+        """
+        차단기를 거쳐 HTTP 요청 수행
+        타임아웃/연결 오류/5xx 응답은 실패로 기록합니다.
+        """
+        is_probe = self._acquire()
+        kwargs.setdefault("timeout", self.timeout)
+        success = False
+        try:
+            response = requests.request(method, url, **kwargs)
+            success = response.status_code < 500
+            return response
+        finally:
+            self._release(success, is_probe)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def status(self):
+        with self._lock:
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "in_flight": self.in_flight,
+            }
+
+
+breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name):
+    """
+    제공자 이름으로 차단기 조회 (없으면 환경 변수 설정으로 생성)
+    예: KAKAO_TIMEOUT_SECONDS가 없으면 OAUTH_TIMEOUT_SECONDS 사용
+    """
+    with _breakers_lock:
+        if name not in breakers:
+            def setting(key, default):
+                return float(os.getenv(f"{name.upper()}_{key}", os.getenv(f"OAUTH_{key}", default)))
+
+            breakers[name] = CircuitBreaker(
+                name,
+                timeout=setting("TIMEOUT_SECONDS", 5),
+                failure_threshold=int(setting("FAILURE_THRESHOLD", 5)),
+                recovery_timeout=setting("RECOVERY_SECONDS", 30),
+                max_concurrent=int(setting("MAX_CONCURRENT", 10)),
+            )
+        return breakers[name]
+
+
+def breaker_status():
+    """헬스 체크용 전체 차단기 상태"""
+    return {name: breaker.status() for name, breaker in breakers.items()}
+
+
+def init_circuit_breakers(app):
+    """외부 호출 실패 시 워커를 붙잡지 않고 503으로 빠르게 응답하도록 에러 핸들러 등록"""
+
+    @app.errorhandler(CircuitOpenError)
+    def handle_circuit_open(e):
+        retry_after = max(1, int(e.retry_after or 1))
+        return f"{e.name} 로그인 서버가 일시적으로 응답하지 않습니다. 잠시 후 다시 시도하세요.", 503, {"Retry-After": str(retry_after)}
+
+    @app.errorhandler(requests.RequestException)
+    def handle_request_error(e):
+        return f"외부 로그인 서버 호출 실패: {str(e)}", 503
@@ -0,0 +1,125 @@
+import gzip
+import threading
+from collections import OrderedDict
+from flask import request
+
+try:
+    import brotli  # requirements.txt에 포함 (설치되지 않은 환경에서는 gzip만 사용)
+except ImportError:
+    brotli = None
+
+
+# ✅ 압축 대상 MIME 타입 (이미지 등 이미 압축된 형식은 제외)
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "text/html",
+    "text/plain",
+    "text/css",
+    "text/javascript",
+    "application/javascript",
+}
+
+
+class CompressedBodyCache:
+    """ETag + 인코딩 기준으로 압축된 본문을 보관하는 LRU 캐시 (총 바이트 수로 크기 제한)"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            body = self._items.get(key)
+            if body is not None:
+                self._items.move_to_end(key)
+            return body
+
+    def set(self, key, body):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._items[key] = body
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted)
+
+
+def _choose_encoding(accept_encoding):
+    """Accept-Encoding 헤더에서 사용할 인코딩 선택 (br 우선, 없으면 gzip)"""
+    if brotli is not None and accept_encoding["br"] > 0:
+        return "br"
+    if accept_encoding["gzip"] > 0:
+        return "gzip"
+    return None
+
+
+def compress_body(data, encoding, config):
+    """설정된 레벨로 본문 압축"""
+    if encoding == "br":
+        return brotli.compress(data, quality=config["COMPRESS_BR_QUALITY"])
+    return gzip.compress(data, compresslevel=config["COMPRESS_LEVEL"], mtime=0)
+
+
+def init_compression(app):
+    """Flask 앱에 응답 압축(after_request)을 등록하는 함수"""
+    app.config.setdefault("COMPRESS_MIN_SIZE", 500)
+    app.config.setdefault("COMPRESS_LEVEL", 6)
+    app.config.setdefault("COMPRESS_BR_QUALITY", 6)
+    app.config.setdefault("COMPRESS_CACHE_MAX_BYTES", 8 * 1024 * 1024)
+    app.config.setdefault("COMPRESS_EXCLUDE_PATHS", {"/health"})
+
+    cache = CompressedBodyCache(app.config["COMPRESS_CACHE_MAX_BYTES"])
+    app.extensions["compression_cache"] = cache
+
+    @app.after_request
+    def compress_response(response):
+        config = app.config
+
+        if request.path in config["COMPRESS_EXCLUDE_PATHS"]:
+            return response
+        if response.direct_passthrough or response.is_streamed:
+            return response
+        if response.status_code < 200 or response.status_code >= 300:
+            return response
+        if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+            return response
+        if "Content-Encoding" in response.headers:
+            return response
+
+        response.vary.add("Accept-Encoding")
+
+        encoding = _choose_encoding(request.accept_encodings)
+        if encoding is None:
+            return response
+
+        data = response.get_data()
+        if len(data) < config["COMPRESS_MIN_SIZE"]:
+            return response
+
+        # ✅ GET 응답은 본문 해시로 ETag 부여 → 같은 본문이면 압축 결과 재사용
+        etag = None
+        if request.method == "GET":
+            etag, _ = response.get_etag()
+            if etag is None:
+                response.add_etag()
+                etag, _ = response.get_etag()
+
+        compressed = cache.get((etag, encoding)) if etag else None
+        if compressed is None:
+            compressed = compress_body(data, encoding, config)
+            if etag:
+                cache.set((etag, encoding), compressed)
+
+        response.set_data(compressed)
+        response.headers["Content-Encoding"] = encoding
+        if etag:
+            # 압축된 표현은 별도 ETag를 가져야 함 (RFC 9110)
+            response.set_etag(f"{etag}-{encoding}")
+            response.make_conditional(request)
+        return response
@@ -0,0 +1,123 @@
+import time
+import queue
+import threading
+from sqlalchemy import insert
+from background import LazyThread
+
+
+class _PendingRow:
+    """배치에 들어간 한 건의 쓰기 요청 (결과 확정 시 done 이벤트 설정)"""
+
+    __slots__ = ("values", "done", "error", "committed", "_callbacks", "_lock")
+
+    def __init__(self, values):
+        self.values = values
+        self.done = threading.Event()
+        self.error = None
+        self.committed = False
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def add_done_callback(self, fn):
+        """결과가 확정되면 fn(error) 호출 (이미 확정되었으면 즉시 호출, 성공이면 error는 None)"""
+        with self._lock:
+            if not self.done.is_set():
+                self._callbacks.append(fn)
+                return
+        fn(self.error)
+
+    def resolve(self):
+        with self._lock:
+            self.done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            try:
+                fn(self.error)
+            except Exception as e:
+                print("❌ 댓글 저장 결과 처리 실패:", str(e))
+
+
+class CommitTimeout(TimeoutError):
+    """대기 시간 안에 배치 커밋이 끝나지 않음 (행은 아직 대기열에 있어 나중에 커밋되거나 실패할 수 있음)"""
+
+    def __init__(self, pending):
+        super().__init__("배치 커밋 대기 시간 초과")
+        self.pending = pending
+
+
+class GroupCommitWriter:
+    """
+    여러 요청의 INSERT를 모아 한 트랜잭션(다중 행 INSERT)으로 커밋하는 쓰기 경로
+    - 요청 스레드는 submit() 후 자신이 포함된 배치가 커밋될 때까지 대기
+    - 백그라운드 스레드가 max_batch 건이 모이거나 flush_interval이 지나면 커밋
+    - 배치 커밋 실패 시 한 건씩 다시 시도하여 문제 있는 행만 실패 처리
+    """
+
+    def __init__(self, app, db, model, flush_interval=0.005, max_batch=500):
+        self.app = app
+        self.db = db
+        self.model = model
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._worker = LazyThread(self._run, "group-commit")
+
+    def submit(self, timeout=10.0, **values):
+        """행 하나를 배치에 추가하고 커밋 완료(내구성 확보)까지 대기 (시간 초과 시 CommitTimeout)"""
+        self._worker.ensure_started()
+        pending = _PendingRow(values)
+        self._queue.put(pending)
+        if not pending.done.wait(timeout):
+            raise CommitTimeout(pending)
+        if pending.error is not None:
+            raise pending.error
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            try:
+                with self.app.app_context():
+                    self._flush(batch)
+            except Exception as e:
+                # rollback / app context 정리 실패 등 → 커밋이 확인되지 않은 행은 실패 처리 (스레드는 계속 동작)
+                print("❌ 댓글 배치 커밋 실패:", str(e))
+                for pending in batch:
+                    if not pending.committed and pending.error is None:
+                        pending.error = e
+            finally:
+                for pending in batch:
+                    pending.resolve()
+
+    def _flush(self, batch):
+        session = self.db.session
+        try:
+            session.execute(insert(self.model), [p.values for p in batch])
+            session.commit()
+            for pending in batch:
+                pending.committed = True
+            return
+        except Exception:
+            session.rollback()
+
+        # 배치 실패 → 한 건씩 재시도 (예: 그 사이 삭제된 게시글의 댓글)
+        for pending in batch:
+            try:
+                session.execute(insert(self.model), [pending.values])
+                session.commit()
+                pending.committed = True
+            except Exception as e:
+                session.rollback()
+                pending.error = e
@@ -0,0 +1,166 @@
+import json
+import time
+import hashlib
+from functools import wraps
+from flask import request, jsonify, current_app, make_response, Response, g
+from flask_jwt_extended import get_jwt_identity
+from cache_backends import make_cache
+
+
+PENDING = "pending"
+MAX_KEY_LENGTH = 255
+MAX_CLAIM_ATTEMPTS = 3  # 키가 해제 / 만료되어 다시 처리 권한을 얻으려는 최대 횟수
+
+
+class IdempotencyStore:
+    """
+    Idempotency-Key 처리 결과 저장소
+    - 처리 중: (PENDING, fingerprint) 를 짧은 TTL로 add → 동시에 들어온 같은 키 요청은 결과를 기다림
+    - 처리 완료: (fingerprint, status, body, mimetype) 를 ttl 동안 보관 → 재시도는 저장된 응답 그대로 반환
+    """
+
+    def __init__(self, cache, ttl=86400, lock_ttl=60, wait_timeout=10.0, poll_interval=0.05):
+        self.cache = cache
+        self.ttl = ttl
+        self.lock_ttl = lock_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+
+    def claim(self, key, fingerprint):
+        """처음 들어온 요청이면 True (처리 권한 획득, make_cache의 add는 만료된 항목을 없는 것으로 봄)"""
+        return self.cache.add(key, (PENDING, fingerprint), timeout=self.lock_ttl)
+
+    def wait_for_result(self, key):
+        """다른 요청이 처리 중이면 완료될 때까지 대기 후 결과 반환 (없으면 None)"""
+        deadline = time.monotonic() + self.wait_timeout
+        while True:
+            record = self.cache.get(key)
+            if record is None or record[0] != PENDING:
+                return record
+            if time.monotonic() >= deadline:
+                return record
+            time.sleep(self.poll_interval)
+
+    def save(self, key, fingerprint, response):
+        self.cache.set(key, (fingerprint, response.status_code, response.get_data(), response.mimetype), timeout=self.ttl)
+
+    def release(self, key):
+        self.cache.delete(key)
+
+    def finish(self, key, fingerprint, response):
+        """처리 결과 기록 (서버 오류는 저장하지 않아 재시도 시 다시 처리되도록 함)"""
+        if response.status_code >= 500:
+            self.release(key)
+        else:
+            self.save(key, fingerprint, response)
+
+    def keep_pending(self, key, fingerprint):
+        """결과가 응답 이후에 확정되는 요청 → 처리 중 표시를 lock_ttl 동안 다시 유지"""
+        self.cache.set(key, (PENDING, fingerprint), timeout=self.lock_ttl)
+
+
+def init_idempotency(app):
+    app.config.setdefault("IDEMPOTENCY_BACKEND", "memory")
+    app.config.setdefault("IDEMPOTENCY_MAX_KEYS", 10000)
+    app.config.setdefault("IDEMPOTENCY_TTL", 86400)
+    cache = make_cache(
+        "idempotency",
+        backend=app.config["IDEMPOTENCY_BACKEND"],
+        threshold=app.config["IDEMPOTENCY_MAX_KEYS"],
+        default_timeout=app.config["IDEMPOTENCY_TTL"],
+        redis_url=app.config.get("IDEMPOTENCY_REDIS_URL"),
+    )
+    app.extensions["idempotency"] = IdempotencyStore(cache, ttl=app.config["IDEMPOTENCY_TTL"])
+
+
+def request_fingerprint():
+    """같은 키로 다른 내용을 보낸 요청을 구분하기 위한 요청 본문 해시"""
+    h = hashlib.sha256()
+    h.update(request.path.encode())
+    if request.is_json:
+        h.update(request.get_data())
+    for name, value in sorted(request.form.items(multi=True)):
+        h.update(f"{name}={value}\0".encode())
+    for name, file in sorted(request.files.items(multi=True), key=lambda item: item[0]):
+        h.update(f"{name}:{file.filename}\0".encode())
+        for chunk in iter(lambda: file.stream.read(65536), b""):
+            h.update(chunk)
+        file.stream.seek(0)
+    return h.hexdigest()[:32]
+
+
+def defer_idempotent_result():
+    """
+    응답 시점에 처리 결과가 아직 확정되지 않은 경우(예: 그룹 커밋 대기 시간 초과) 뷰에서 호출
+    현재 요청의 Idempotency-Key를 처리 중 상태로 남겨 두고, 결과 확정 시 호출할 resolve(status, body) 반환
+    (Idempotency-Key가 없는 요청이면 None)
+    """
+    pending = g.get("idempotency")
+    if pending is None:
+        return None
+    store, key, fingerprint = pending
+    store.keep_pending(key, fingerprint)
+    g.idempotency_deferred = True
+
+    def resolve(status, body):
+        store.finish(key, fingerprint, Response(json.dumps(body), status=status, mimetype="application/json"))
+
+    return resolve
+
+
+def _replay(record):
+    _, status, body, mimetype = record
+    response = Response(body, status=status, mimetype=mimetype)
+    response.headers["Idempotent-Replayed"] = "true"
+    return response
+
+
+def idempotent(scope):
+    """
+    Idempotency-Key 헤더가 있으면 같은 사용자 / 같은 키 요청을 한 번만 처리하는 데코레이터
+    (@jwt_required() 아래에 사용)
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            idempotency_key = request.headers.get("Idempotency-Key")
+            if not idempotency_key:
+                return view(*args, **kwargs)
+            if len(idempotency_key) > MAX_KEY_LENGTH:
+                return jsonify({"error": "Idempotency-Key가 너무 깁니다."}), 400
+
+            store = current_app.extensions["idempotency"]
+            key = f"{scope}:{get_jwt_identity()}:{idempotency_key}"
+            fingerprint = request_fingerprint()
+
+            for _ in range(MAX_CLAIM_ATTEMPTS):
+                if store.claim(key, fingerprint):
+                    break
+                record = store.wait_for_result(key)
+                if record is None:
+                    # 먼저 처리하던 요청이 실패했거나 결과가 만료됨 → 다시 처리 권한 획득 시도
+                    continue
+                if record[0] == PENDING:
+                    return jsonify({"error": "같은 Idempotency-Key 요청이 처리 중입니다."}), 409, {"Retry-After": "1"}
+                if record[0] != fingerprint:
+                    return jsonify({"error": "같은 Idempotency-Key로 다른 내용의 요청을 보낼 수 없습니다."}), 422
+                return _replay(record)
+            else:
+                return jsonify({"error": "같은 Idempotency-Key 요청이 처리 중입니다."}), 409, {"Retry-After": "1"}
+
+            g.idempotency = (store, key, fingerprint)
+            try:
+                response = make_response(view(*args, **kwargs))
+            except Exception:
+                store.release(key)
+                raise
+
+            # 결과가 나중에 확정되는 요청은 defer_idempotent_result()의 resolve가 기록
+            if not g.pop("idempotency_deferred", False):
+                store.finish(key, fingerprint, response)
+            return response
+
+        return wrapper
+
+    return decorator
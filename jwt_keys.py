@@ -0,0 +1,137 @@
+import os
+import json
+import glob
+import hashlib
+import secrets
+from jwt.algorithms import RSAAlgorithm, OKPAlgorithm
+from jwt.exceptions import InvalidTokenError
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa, ed25519
+
+
+ASYMMETRIC_ALGORITHMS = {"RS256", "EdDSA"}
+
+
+class KeyRing:
+    """
+    JWT 서명/검증 키 모음
+    - 서명은 활성 키(active_kid) 하나로만 수행
+    - 검증은 kid로 조회 (교체 전 키도 공개키만 남겨두면 계속 검증 가능)
+    """
+
+    def __init__(self, algorithm):
+        self.algorithm = algorithm
+        self.private_keys = {}
+        self.public_keys = {}
+        self.active_kid = None
+        self._jwks_body = None
+
+    def add_private_key(self, kid, private_key):
+        self.private_keys[kid] = private_key
+        self.public_keys[kid] = private_key.public_key()
+
+    def add_public_key(self, kid, public_key):
+        self.public_keys[kid] = public_key
+
+    def signing_key(self):
+        return self.private_keys[self.active_kid]
+
+    def verification_key(self, kid):
+        key = self.public_keys.get(kid)
+        if key is None:
+            raise InvalidTokenError(f"알 수 없는 서명 키(kid): {kid}")
+        return key
+
+    def jwks_body(self):
+        """JWKS 응답 본문 (키는 프로세스 시작 후 바뀌지 않으므로 한 번만 직렬화)"""
+        if self._jwks_body is None:
+            to_jwk = RSAAlgorithm.to_jwk if self.algorithm == "RS256" else OKPAlgorithm.to_jwk
+            keys = []
+            for kid, public_key in sorted(self.public_keys.items()):
+                jwk = to_jwk(public_key, as_dict=True)
+                jwk.update({"kid": kid, "use": "sig", "alg": self.algorithm})
+                keys.append(jwk)
+            self._jwks_body = json.dumps({"keys": keys}, separators=(",", ":"))
+        return self._jwks_body
+
+    def jwks_etag(self):
+        return hashlib.sha1(self.jwks_body().encode()).hexdigest()
+
+
+def _generate_key(algorithm):
+    if algorithm == "RS256":
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return ed25519.Ed25519PrivateKey.generate()
+
+
+def load_key_ring(algorithm, keys_dir=None, active_kid=None, allow_ephemeral=False):
+    """
+    키 디렉토리에서 `<kid>.pem` 파일을 읽어 KeyRing 생성
+    - 개인키 PEM: 서명 + 검증
+    - 공개키 PEM: 검증 전용 (교체된 이전 키)
+    - 활성 kid 미지정 시 파일명 기준 가장 마지막 개인키 사용
+    - 개인키가 없으면 ValueError (allow_ephemeral이면 개발용 임시 키 생성)
+    """
+    ring = KeyRing(algorithm)
+
+    if keys_dir:
+        for path in sorted(glob.glob(os.path.join(keys_dir, "*.pem"))):
+            kid = os.path.splitext(os.path.basename(path))[0]
+            with open(path, "rb") as f:
+                pem = f.read()
+            if b"PRIVATE KEY" in pem:
+                ring.add_private_key(kid, serialization.load_pem_private_key(pem, password=None))
+            else:
+                ring.add_public_key(kid, serialization.load_pem_public_key(pem))
+
+    if not ring.private_keys:
+        if not allow_ephemeral:
+            # 워커마다 다른 임시 키로 서명하면 다른 워커 / 다운스트림 서비스에서 검증할 수 없으므로 시작 단계에서 중단
+            raise ValueError(f"{algorithm} 서명용 개인키가 없습니다. JWT_KEYS_DIR에 <kid>.pem 개인키를 두세요.")
+        # ⚠️ 개발용 (JWT_DEV_EPHEMERAL_KEY=1): 프로세스마다 다른 kid로 임시 키 생성 → 단일 프로세스에서만 사용
+        kid = f"dev-{secrets.token_hex(4)}"
+        print(f"⚠️ JWT 서명 키가 없어 임시 키(kid={kid})를 생성합니다. 개발 환경에서만 사용하세요.")
+        ring.add_private_key(kid, _generate_key(algorithm))
+
+    ring.active_kid = active_kid or sorted(ring.private_keys)[-1]
+    if ring.active_kid not in ring.private_keys:
+        raise ValueError(f"활성 서명 키(kid={ring.active_kid})의 개인키가 없습니다.")
+    return ring
+
+
+def init_jwt_keys(app, jwt):
+    """비대칭 알고리즘(RS256/EdDSA) 사용 시 JWTManager에 kid 기반 서명/검증 콜백 등록"""
+    algorithm = app.config.get("JWT_ALGORITHM", "HS256")
+    if algorithm not in ASYMMETRIC_ALGORITHMS:
+        return None
+
+    ring = load_key_ring(
+        algorithm,
+        app.config.get("JWT_KEYS_DIR"),
+        app.config.get("JWT_ACTIVE_KID"),
+        allow_ephemeral=app.config.get("JWT_DEV_EPHEMERAL_KEY", False),
+    )
+    app.extensions["jwt_key_ring"] = ring
+
+    # 교체 기간 동안 기존 HS256 토큰도 허용할지 여부
+    legacy_hs256 = app.config.get("JWT_LEGACY_HS256", False)
+    app.config["JWT_DECODE_ALGORITHMS"] = [algorithm, "HS256"] if legacy_hs256 else [algorithm]
+
+    @jwt.additional_headers_loader
+    def add_kid_header(identity):
+        return {"kid": ring.active_kid}
+
+    @jwt.encode_key_loader
+    def encode_key(identity):
+        return ring.signing_key()
+
+    @jwt.decode_key_loader
+    def decode_key(jwt_header, jwt_payload):
+        alg = jwt_header.get("alg")
+        if legacy_hs256 and alg == "HS256" and "kid" not in jwt_header:
+            return app.config["JWT_SECRET_KEY"]
+        if alg != algorithm:
+            raise InvalidTokenError(f"허용되지 않은 서명 알고리즘: {alg}")
+        return ring.verification_key(jwt_header.get("kid"))
+
+    return ring
@@ -0,0 +1,145 @@
+import os
+import time
+import tempfile
+import bisect
+import threading
+from collections import deque
+from flask import Response
+from sqlalchemy.orm import joinedload
+from models import Post
+
+
+def post_summary(post):
+    """/posts 목록 응답과 같은 형태의 게시글 요약"""
+    return {
+        "id": post.id,
+        "title": post.title,
+        "content": post.content,
+        "image_url": post.image_url,
+        "created_at": post.created_at,
+        "author": post.user.name if post.user else "Unknown",
+        "view_count": post.view_count,
+    }
+
+
+class FileSignal:
+    """
+    같은 서버의 워커들 사이에서 쓰는 가벼운 변경 신호
+    bump() 시 파일을 갱신하고, 다른 워커는 mtime(stat 한 번)으로 변경 여부를 확인합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def version(self):
+        # os.replace로 매번 새 파일이 되므로 inode까지 비교 (mtime 해상도가 낮은 파일시스템 대비)
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns)
+
+    def bump(self):
+        tmp_path = f"{self.path}.{os.getpid()}"
+        with open(tmp_path, "w") as f:
+            f.write(str(time.time_ns()))
+        os.replace(tmp_path, self.path)
+        return self.version()
+
+
+class LatestFeed:
+    """
+    최신 게시글 N개를 워커 메모리에 유지하는 링 버퍼 (첫 페이지를 DB 조회 없이 응답)
+    - 게시글 작성/삭제 시 해당 워커는 버퍼를 직접 갱신하고 신호를 보냄
+    - 다른 워커는 신호 변경을 감지하면 다음 요청에서 DB에서 다시 적재
+    - max_age가 지나면 조회수 등 갱신을 위해 다시 적재
+    """
+
+    def __init__(self, app, size=50, signal_path=None, max_age=60.0):
+        self.app = app
+        self.size = size
+        self.max_age = max_age
+        self.signal = FileSignal(signal_path or os.path.join(tempfile.gettempdir(), "banana-latest-feed.signal"))
+
+        self._items = deque(maxlen=size)
+        self._bodies = {}  # per_page -> 직렬화된 JSON
+        self._loaded_at = None
+        self._seen_version = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        posts = (
+            Post.query.options(joinedload(Post.user))
+            .order_by(Post.id.desc())
+            .limit(self.size)
+            .all()
+        )
+        self._items = deque((post_summary(p) for p in posts), maxlen=self.size)
+        self._bodies = {}
+        self._loaded_at = time.monotonic()
+
+    def _ensure_fresh(self):
+        version = self.signal.version()
+        if (
+            self._loaded_at is None
+            or version != self._seen_version
+            or time.monotonic() - self._loaded_at > self.max_age
+        ):
+            self._seen_version = version
+            self._load()
+
+    def page_response(self, per_page):
+        """첫 페이지 응답 (per_page가 버퍼 크기보다 크면 None → DB 조회)"""
+        if per_page > self.size:
+            return None
+        with self._lock:
+            self._ensure_fresh()
+            body = self._bodies.get(per_page)
+            if body is None:
+                body = self.app.json.dumps(list(self._items)[:per_page])
+                self._bodies[per_page] = body
+        return Response(body, mimetype="application/json")
+
+    def add(self, post):
+        """새 게시글을 버퍼에 id 내림차순 위치로 추가"""
+        summary = post_summary(post)
+        with self._lock:
+            if self._loaded_at is not None:
+                self._insert(summary)
+            self._bump()
+
+    def _insert(self, summary):
+        items = self._items
+        if not items or summary["id"] > items[0]["id"]:
+            # 대부분의 경우: 가장 최신 게시글
+            items.appendleft(summary)
+            self._bodies = {}
+            return
+        # 동시에 커밋된 게시글의 add() 순서가 id 순서와 다를 수 있음 → id 위치를 찾아 삽입
+        ids = [-item["id"] for item in items]
+        position = bisect.bisect_left(ids, -summary["id"])
+        if position < len(ids) and ids[position] == -summary["id"]:
+            return
+        if position == len(ids) and len(items) == self.size:
+            return  # 버퍼의 가장 오래된 게시글보다 오래됨 → 첫 페이지 밖
+        ordered = list(items)
+        ordered.insert(position, summary)
+        self._items = deque(ordered[:self.size], maxlen=self.size)
+        self._bodies = {}
+
+    def _bump(self):
+        # 다른 워커의 변경을 아직 반영하지 않았다면 다음 요청에서 다시 적재
+        if self.signal.version() != self._seen_version:
+            self._loaded_at = None
+        self._seen_version = self.signal.bump()
+
+    def remove(self, post_id):
+        """삭제된 게시글을 버퍼에서 제거 (빈 자리는 다음 적재 때 채움)"""
+        with self._lock:
+            before = len(self._items)
+            self._items = deque((item for item in self._items if item["id"] != post_id), maxlen=self.size)
+            if len(self._items) != before:
+                self._bodies = {}
+                # 버퍼가 줄었으므로 더 오래된 게시글로 채우기 위해 다시 적재
+                self._loaded_at = None
+            self._bump()
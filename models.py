@@ -1,5 +1,6 @@
 from flask_sqlalchemy import SQLAlchemy
 import datetime
+import os
 
 
 db = SQLAlchemy()
@@ -23,12 +24,40 @@ class Post(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     user = db.relationship('User', backref=db.backref('posts', lazy=True))
     image_url = db.Column(db.String(255))  # 이미지 URL 추가
-    created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow, index=True)
+    view_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")  # 조회수 (주기적으로 일괄 반영)
+
+# ✅ 댓글 스레드 (materialized path)
+# path = 조상 세그먼트들을 "."으로 이은 문자열, 세그먼트는 고정 길이(16자리 hex, 작성 시각 μs + 난수)
+# → path 순 정렬이 곧 스레드 순서, 하위 트리는 [path, path + "/") 범위 조회 한 번으로 가져옴
+COMMENT_PATH_SEGMENT_LENGTH = 16
+COMMENT_MAX_DEPTH = 15  # 16 * 15 + 14 ≤ 255
+
+
+def comment_path_segment(when=None):
+    """시간순으로 정렬되는 고정 길이 path 세그먼트 생성 (DB id 없이 INSERT 전에 계산 가능)"""
+    when = when or datetime.datetime.utcnow()
+    micros = int(when.replace(tzinfo=datetime.timezone.utc).timestamp() * 1_000_000)
+    return f"{micros:013x}{int.from_bytes(os.urandom(2), 'big') % 4096:03x}"
+
+
+def comment_subtree_end(path):
+    """하위 트리 범위의 끝 ("." 다음 문자인 "/"를 붙여 [path, end) 범위로 조회)"""
+    return path + "/"
+
 
 class Comment(db.Model):
+    __table_args__ = (
+        db.Index("ix_comment_post_id_path", "post_id", "path"),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
-    post_id = db.Column(db.Integer, db.ForeignKey('post.id', ondelete="CASCADE"), nullable=False)
+    post_id = db.Column(db.Integer, db.ForeignKey('post.id', ondelete="CASCADE"), nullable=False, index=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete="CASCADE"), nullable=False)
+    parent_id = db.Column(db.Integer, db.ForeignKey('comment.id', ondelete="CASCADE"))  # 답글인 경우 부모 댓글
+    # Postgres에서는 범위 조회가 인덱스를 타도록 바이트 순서(C) 정렬 사용
+    path = db.Column(db.String(255).with_variant(db.String(255, collation="C"), "postgresql"), nullable=False)
+    depth = db.Column(db.Integer, nullable=False, default=0, server_default="0")
     content = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
 
@@ -0,0 +1,191 @@
+import time
+import datetime
+import threading
+from flask import Response
+from sqlalchemy import func, update, bindparam, or_
+from models import db, Post, Comment, User
+from background import LazyThread
+
+
+class ViewCounter:
+    """워커 메모리에 조회수를 모아두었다가 주기적으로 DB에 반영 (조회 요청이 쓰기가 되지 않도록)"""
+
+    def __init__(self):
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def record(self, post_id):
+        with self._lock:
+            self._counts[post_id] = self._counts.get(post_id, 0) + 1
+
+    def drain(self):
+        with self._lock:
+            counts, self._counts = self._counts, {}
+        return counts
+
+    def flush(self):
+        """쌓인 조회수를 executemany UPDATE 한 번으로 반영"""
+        counts = self.drain()
+        if not counts:
+            return
+        stmt = (
+            update(Post.__table__)
+            .where(Post.__table__.c.id == bindparam("post_id"))
+            .values(view_count=Post.__table__.c.view_count + bindparam("delta"))
+        )
+        try:
+            db.session.execute(stmt, [{"post_id": k, "delta": v} for k, v in counts.items()])
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            # 실패한 조회수는 다음 주기에 다시 반영
+            with self._lock:
+                for post_id, delta in counts.items():
+                    self._counts[post_id] = self._counts.get(post_id, 0) + delta
+            print("❌ 조회수 반영 실패:", str(e))
+
+
+class HotRanking:
+    """
+    인기 게시글 순위 (시간 감쇠 점수)
+    score = (조회수 + 댓글 가중치 * 댓글수) / (경과 시간(h) + 2) ^ gravity
+
+    최근 window_hours 이내 게시글만 후보로 유지하고, 갱신 시에는
+    새 게시글 / 새 댓글(읽은 행의 최대 id 이후)만 읽어 증분 반영합니다.
+    resync_every 회마다 창 안의 게시글과 댓글 수를 전부 다시 읽어
+    늦게 커밋된 행과 댓글 삭제분을 보정합니다.
+    """
+
+    def __init__(self, size=50, window_hours=72, comment_weight=5.0, gravity=1.5, resync_every=20):
+        self.size = size
+        self.window_hours = window_hours
+        self.comment_weight = comment_weight
+        self.gravity = gravity
+        self.resync_every = resync_every
+
+        self.candidates = {}  # post_id -> dict(요약 + views + comments)
+        self.last_post_id = 0
+        self.last_comment_id = 0
+        self.refresh_count = 0
+        self.body = None
+        self._lock = threading.Lock()
+
+    def score(self, item, now):
+        age_hours = (now - item["created_at"]).total_seconds() / 3600
+        points = item["view_count"] + self.comment_weight * item["comment_count"]
+        return points / (max(age_hours, 0) + 2) ** self.gravity
+
+    def _load_new_posts(self, since, full):
+        """
+        새 게시글을 후보에 추가하고 추가된 id 목록 반환
+        full이면 창 전체를 다시 읽어 늦게 커밋되어(더 큰 id보다 나중에 보인) 놓친 게시글도 추가
+        """
+        query = (
+            db.session.query(Post.id, Post.title, Post.image_url, Post.created_at, Post.view_count, User.name)
+            .outerjoin(User, Post.user_id == User.id)
+            .filter(Post.created_at >= since)
+        )
+        if not full:
+            query = query.filter(Post.id > self.last_post_id)
+
+        added = []
+        for row in query.all():
+            # 워터마크는 실제로 읽은 행 기준 (별도 max(id) 조회 사이에 커밋된 게시글을 건너뛰지 않도록)
+            self.last_post_id = max(self.last_post_id, row.id)
+            if row.id in self.candidates:
+                continue
+            self.candidates[row.id] = {
+                "id": row.id,
+                "title": row.title,
+                "image_url": row.image_url,
+                "created_at": row.created_at,
+                "author": row.name or "Unknown",
+                "view_count": row.view_count or 0,
+                "comment_count": 0,
+            }
+            added.append(row.id)
+        return added
+
+    def _load_comment_counts(self, full, added):
+        query = (
+            db.session.query(Comment.post_id, func.count(Comment.id), func.max(Comment.id))
+            .filter(Comment.post_id.in_(list(self.candidates)))
+        )
+        if full:
+            for item in self.candidates.values():
+                item["comment_count"] = 0
+        elif added:
+            # 이번에 추가된 게시글은 워터마크 이전 댓글까지 모두 집계
+            query = query.filter(or_(Comment.id > self.last_comment_id, Comment.post_id.in_(added)))
+        else:
+            query = query.filter(Comment.id > self.last_comment_id)
+
+        for post_id, count, max_id in query.group_by(Comment.post_id).all():
+            self.candidates[post_id]["comment_count"] += count
+            self.last_comment_id = max(self.last_comment_id, max_id)
+
+    def refresh(self, app):
+        """DB에서 변경분만 읽어 순위를 다시 계산하고 응답 본문을 미리 직렬화"""
+        now = datetime.datetime.utcnow()
+        since = now - datetime.timedelta(hours=self.window_hours)
+        full = self.refresh_count % self.resync_every == 0
+
+        with self._lock:
+            for post_id in [k for k, v in self.candidates.items() if v["created_at"] < since]:
+                del self.candidates[post_id]
+
+            added = self._load_new_posts(since, full)
+
+            if self.candidates:
+                # 조회수는 다른 워커의 반영분까지 포함되도록 DB 값 사용, 삭제된 게시글은 제외
+                views = dict(
+                    db.session.query(Post.id, Post.view_count).filter(Post.id.in_(list(self.candidates))).all()
+                )
+                for post_id in [k for k in self.candidates if k not in views]:
+                    del self.candidates[post_id]
+                for post_id, view_count in views.items():
+                    self.candidates[post_id]["view_count"] = view_count or 0
+
+            if self.candidates:
+                self._load_comment_counts(full, added)
+
+            ranked = sorted(self.candidates.values(), key=lambda item: self.score(item, now), reverse=True)
+            top = [dict(item, score=round(self.score(item, now), 4)) for item in ranked[:self.size]]
+            self.body = app.json.dumps(top)
+            self.refresh_count += 1
+
+
+class PostStats:
+    """조회수 반영 + 인기 순위 갱신을 담당하는 워커별 백그라운드 스레드"""
+
+    def __init__(self, app, flush_interval=10.0, refresh_interval=30.0, **ranking_options):
+        self.app = app
+        self.flush_interval = flush_interval
+        self.refresh_interval = refresh_interval
+        self.views = ViewCounter()
+        self.ranking = HotRanking(**ranking_options)
+        self._worker = LazyThread(self._run, "post-stats")
+
+    def record_view(self, post_id):
+        self._worker.ensure_started()
+        self.views.record(post_id)
+
+    def hot_response(self):
+        self._worker.ensure_started()
+        if self.ranking.body is None:
+            self.ranking.refresh(self.app)
+        return Response(self.ranking.body, mimetype="application/json")
+
+    def _run(self):
+        next_refresh = 0.0
+        while True:
+            time.sleep(self.flush_interval)
+            with self.app.app_context():
+                self.views.flush()
+                if time.monotonic() >= next_refresh:
+                    try:
+                        self.ranking.refresh(self.app)
+                    except Exception as e:
+                        db.session.rollback()
+                        print("❌ 인기 게시글 갱신 실패:", str(e))
+                    next_refresh = time.monotonic() + self.refresh_interval
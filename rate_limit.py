@@ -0,0 +1,168 @@
+import os
+import time
+import threading
+from functools import wraps
+from flask import request, jsonify, current_app
+from flask_jwt_extended import get_jwt_identity
+
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600}
+
+
+def parse_limit(spec):
+    """"30/minute" → (초당 토큰 수, 버킷 크기)"""
+    count, period = spec.split("/")
+    count = int(count)
+    return count / PERIODS[period], count
+
+
+class MemoryBuckets:
+    """
+    워커 메모리 토큰 버킷
+    키마다 (남은 토큰, 마지막 갱신 시각) 하나만 보관하고, 마지막 접근 순서로 정렬해
+    idle_timeout 동안 쓰이지 않은 키(이미 버킷이 가득 찬 상태)부터 제거합니다.
+    """
+
+    def __init__(self, max_keys=100000, idle_timeout=600.0):
+        self.max_keys = max_keys
+        self.idle_timeout = idle_timeout
+        self._buckets = {}  # dict는 삽입 순서를 유지 → 꺼냈다 다시 넣으면 가장 최근 접근 키가 됨
+        self._lock = threading.Lock()
+
+    def consume(self, key, rate, burst):
+        """토큰 1개 사용 시도 → (허용 여부, 재시도까지 남은 초)"""
+        now = time.monotonic()
+        buckets = self._buckets
+        with self._lock:
+            bucket = buckets.pop(key, None)
+            if bucket is None:
+                tokens = burst
+            else:
+                tokens = min(burst, bucket[0] + (now - bucket[1]) * rate)
+
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            buckets[key] = (tokens, now)
+
+            # 가장 오래 쓰이지 않은 키부터 정리 (호출당 상수 시간)
+            while buckets and (len(buckets) > self.max_keys or now - buckets[next(iter(buckets))][1] >= self.idle_timeout):
+                del buckets[next(iter(buckets))]
+
+        return allowed, 0 if allowed else (1 - tokens) / rate
+
+
+class RedisBuckets:
+    """여러 워커 / 서버가 공유하는 Redis 토큰 버킷 (Lua 스크립트로 원자적 처리, 키는 가득 찰 시간 뒤 만료)"""
+
+    SCRIPT = """
+    local rate = tonumber(ARGV[1])
+    local burst = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local bucket = redis.call('HMGET', KEYS[1], 't', 'ts')
+    local tokens = burst
+    if bucket[1] then
+        tokens = math.min(burst, tonumber(bucket[1]) + (now - tonumber(bucket[2])) * rate)
+    end
+    local allowed = 0
+    if tokens >= 1 then
+        allowed = 1
+        tokens = tokens - 1
+    end
+    redis.call('HSET', KEYS[1], 't', tokens, 'ts', now)
+    redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000))
+    return {allowed, tostring((1 - tokens) / rate)}
+    """
+
+    def __init__(self, redis_url, prefix="ratelimit:"):
+        import redis
+
+        self.prefix = prefix
+        self._script = redis.from_url(redis_url).register_script(self.SCRIPT)
+
+    def consume(self, key, rate, burst):
+        allowed, retry_after = self._script(keys=[self.prefix + key], args=[rate, burst, time.time()])
+        return bool(allowed), 0 if allowed else float(retry_after)
+
+
+class RateLimiter:
+    """blueprint별 IP / 사용자 한도 설정과 버킷 저장소를 묶은 객체"""
+
+    def __init__(self, buckets, limits, enabled=True, trust_proxy=False):
+        self.buckets = buckets
+        self.enabled = enabled
+        self.trust_proxy = trust_proxy
+        # {"posts": {"user": "10/minute", ...}} → {"posts": {"user": (rate, burst), ...}}
+        self.limits = {
+            blueprint: {kind: parse_limit(spec) for kind, spec in rules.items()}
+            for blueprint, rules in limits.items()
+        }
+
+    def client_ip(self):
+        if self.trust_proxy and request.access_route:
+            return request.access_route[0]
+        return request.remote_addr or "unknown"
+
+    def check(self):
+        """현재 요청이 한도를 넘으면 재시도까지 남은 초, 아니면 None"""
+        rules = self.limits.get(request.blueprint)
+        if not self.enabled or not rules:
+            return None
+
+        retry_after = None
+        for kind, (rate, burst) in rules.items():
+            if kind == "user":
+                key = f"{request.blueprint}:user:{get_jwt_identity()}"
+            else:
+                key = f"{request.blueprint}:ip:{self.client_ip()}"
+            allowed, wait = self.buckets.consume(key, rate, burst)
+            if not allowed:
+                retry_after = max(retry_after or 0, wait)
+        return retry_after
+
+
+def init_rate_limiter(app):
+    """RATE_LIMITS 설정으로 RateLimiter 생성 (RATE_LIMIT_<BLUEPRINT>_<IP|USER> 환경 변수로 개별 조정)"""
+    limits = {bp: dict(rules) for bp, rules in app.config.get("RATE_LIMITS", {}).items()}
+    for blueprint, rules in limits.items():
+        for kind in ("ip", "user"):
+            override = os.getenv(f"RATE_LIMIT_{blueprint.upper()}_{kind.upper()}")
+            if override:
+                rules[kind] = override
+
+    limiter = RateLimiter(
+        None,
+        limits,
+        enabled=app.config.get("RATE_LIMIT_ENABLED", True),
+        trust_proxy=app.config.get("RATE_LIMIT_TRUST_PROXY", False),
+    )
+
+    if app.config.get("RATE_LIMIT_BACKEND", "memory") == "redis":
+        limiter.buckets = RedisBuckets(app.config["RATE_LIMIT_REDIS_URL"])
+    else:
+        # 버킷이 가득 차는 시간보다 오래 쉰 키는 지워도 결과가 같으므로 그 시간을 idle 기준으로 사용
+        refill_times = [burst / rate for rules in limiter.limits.values() for rate, burst in rules.values()]
+        limiter.buckets = MemoryBuckets(
+            max_keys=app.config.get("RATE_LIMIT_MAX_KEYS", 100000),
+            idle_timeout=max(refill_times, default=600.0),
+        )
+
+    app.extensions["rate_limiter"] = limiter
+
+
+def rate_limited(view):
+    """
+    blueprint에 설정된 토큰 버킷 한도 적용 (초과 시 429 + Retry-After)
+    사용자 한도("user")가 있는 blueprint에서는 @jwt_required() 아래에 사용
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        retry_after = current_app.extensions["rate_limiter"].check()
+        if retry_after is not None:
+            return jsonify({"error": "요청이 너무 많습니다. 잠시 후 다시 시도하세요."}), 429, {
+                "Retry-After": str(max(1, int(retry_after + 0.999)))
+            }
+        return view(*args, **kwargs)
+
+    return wrapper
@@ -1,5 +1,6 @@
-from flask import Blueprint, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask import Blueprint, jsonify, current_app, request, Response
+import hmac
+from flask_jwt_extended import jwt_required, get_jwt_identity, decode_token
 from models import User
 
 auth = Blueprint("auth", __name__)
@@ -67,3 +68,152 @@ def get_current_user():
     except Exception as e:
         print("🚨 [DEBUG] JWT 인증 실패:", str(e))
         return jsonify({"error": f"토큰 검증 실패: {str(e)}"}), 401
+
+
+# ✅ 다른 서비스가 토큰을 직접 검증할 수 있도록 공개키(JWKS) 제공
+@auth.route("/.well-known/jwks.json", methods=["GET"])
+def get_jwks():
+    """
+    JWT 검증용 공개키 목록 (JWKS)
+    토큰 헤더의 kid와 일치하는 키로 서명을 검증할 수 있습니다.
+    ---
+    tags:
+      - Authentication
+    security: []
+    responses:
+      200:
+        description: JWKS 반환 (Cache-Control / ETag 포함)
+        schema:
+          type: object
+          properties:
+            keys:
+              type: array
+              items:
+                type: object
+      404:
+        description: 비대칭 서명(RS256/EdDSA)을 사용하지 않는 경우
+    """
+    ring = current_app.extensions.get("jwt_key_ring")
+    if ring is None:
+        return jsonify({"error": "비대칭 서명 키가 설정되지 않았습니다."}), 404
+
+    response = Response(ring.jwks_body(), mimetype="application/json")
+    response.set_etag(ring.jwks_etag())
+    response.cache_control.public = True
+    response.cache_control.max_age = current_app.config.get("JWKS_MAX_AGE", 3600)
+    return response.make_conditional(request)
+
+
+# ✅ 내부 서비스용 토큰 일괄 검증 (여러 토큰 검증 + 사용자 정보를 한 번의 요청으로 반환)
+@auth.route("/auth/introspect", methods=["POST"])
+def introspect_tokens():
+    """
+    여러 JWT 토큰 일괄 검증
+    토큰을 모두 검증한 뒤, 중복을 제거한 사용자 ID를 한 번의 IN 쿼리로 조회합니다.
+    X-Internal-Key 헤더로 INTROSPECT_API_KEY를 보내야 합니다.
+    키가 설정되지 않으면 비활성화(404)되며, INTROSPECT_ALLOW_PUBLIC=1일 때만 인증 없이 허용합니다.
+    ---
+    tags:
+      - Authentication
+    security: []
+    consumes:
+      - application/json
+    parameters:
+      - in: header
+        name: X-Internal-Key
+        type: string
+        required: false
+        description: 내부 서비스 인증 키
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - tokens
+          properties:
+            tokens:
+              type: array
+              items:
+                type: string
+    responses:
+      200:
+        description: 요청한 순서대로 토큰별 검증 결과 반환
+        schema:
+          type: object
+          properties:
+            results:
+              type: array
+              items:
+                type: object
+                properties:
+                  active:
+                    type: boolean
+                  claims:
+                    type: object
+                  user:
+                    type: object
+                  error:
+                    type: string
+      400:
+        description: tokens 누락 또는 최대 개수 초과
+      401:
+        description: 내부 서비스 인증 실패
+      404:
+        description: INTROSPECT_API_KEY가 설정되지 않아 비활성화됨
+    """
+    api_key = current_app.config.get("INTROSPECT_API_KEY")
+    if not api_key:
+        # 내부 서비스 전용 → 키 없이 공개되지 않도록 명시적으로 허용한 경우에만 동작
+        if not current_app.config.get("INTROSPECT_ALLOW_PUBLIC", False):
+            return jsonify({"error": "토큰 일괄 검증이 비활성화되어 있습니다."}), 404
+    elif not hmac.compare_digest(request.headers.get("X-Internal-Key", ""), api_key):
+        return jsonify({"error": "내부 서비스 인증 실패"}), 401
+
+    tokens = (request.get_json(silent=True) or {}).get("tokens")
+    if not isinstance(tokens, list) or not all(isinstance(t, str) for t in tokens):
+        return jsonify({"error": "tokens 배열을 입력하세요."}), 400
+
+    max_tokens = current_app.config.get("INTROSPECT_MAX_TOKENS", 100)
+    if len(tokens) > max_tokens:
+        return jsonify({"error": f"토큰은 최대 {max_tokens}개까지 검증할 수 있습니다."}), 400
+
+    # ✅ 1단계: 토큰 검증 (같은 토큰은 한 번만 디코딩)
+    decoded = {}
+    for token in tokens:
+        if token in decoded:
+            continue
+        try:
+            decoded[token] = (decode_token(token), None)
+        except Exception as e:
+            decoded[token] = (None, str(e))
+
+    # ✅ 2단계: 사용자 ID를 모아 IN 쿼리 한 번으로 조회
+    user_ids = set()
+    for claims, _ in decoded.values():
+        if claims and str(claims.get("sub", "")).isdigit():
+            user_ids.add(int(claims["sub"]))
+
+    users = {}
+    if user_ids:
+        users = {u.id: u for u in User.query.filter(User.id.in_(user_ids)).all()}
+
+    results = []
+    for token in tokens:
+        claims, error = decoded[token]
+        if claims is None:
+            results.append({"active": False, "error": error})
+            continue
+
+        user = users.get(int(claims["sub"])) if str(claims.get("sub", "")).isdigit() else None
+        if user is None:
+            results.append({"active": False, "error": "사용자를 찾을 수 없습니다."})
+            continue
+
+        results.append({
+            "active": True,
+            "claims": claims,
+            "user": {"id": user.id, "name": user.name, "email": user.email},
+        })
+
+    return jsonify({"results": results}), 200
@@ -1,16 +1,31 @@
 import os
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy.orm import joinedload
 from models import db, Comment, Post, User
+from models import comment_path_segment, comment_subtree_end, COMMENT_MAX_DEPTH
+from idempotency import idempotent, defer_idempotent_result
+from group_commit import CommitTimeout
+from rate_limit import rate_limited
 
 comments = Blueprint("comments", __name__)
 
+
+def _comment_result(error):
+    """그룹 커밋 결과 → (상태 코드, 응답 본문)"""
+    if error is not None:
+        return 500, {"error": f"댓글 저장 실패: {str(error)}"}
+    return 200, {"message": "댓글이 추가되었습니다!"}
+
+
 # ✅ 1️⃣ 댓글 작성 API
 @comments.route("/post/<int:post_id>/comment", methods=["POST"])
 @jwt_required()
+@rate_limited
+@idempotent("create_comment")
 def create_comment(post_id):
     """
-    특정 게시물에 댓글 작성
+    특정 게시물에 댓글 작성 (parent_id를 지정하면 해당 댓글의 답글)
     ---
     tags:
       - Comments
@@ -24,6 +39,11 @@ def create_comment(post_id):
         type: integer
         required: true
         description: 댓글을 작성할 게시물의 ID
+      - in: header
+        name: Idempotency-Key
+        type: string
+        required: false
+        description: 재시도 시 같은 값을 보내면 중복 생성 없이 처음 응답을 그대로 반환
       - in: body
         name: body
         required: true
@@ -36,6 +56,9 @@ def create_comment(post_id):
             content:
               type: string
               description: 댓글 내용
+            parent_id:
+              type: integer
+              description: 답글을 달 부모 댓글 ID (생략 시 최상위 댓글)
     responses:
       200:
         description: 댓글 작성 성공
@@ -45,9 +68,19 @@ def create_comment(post_id):
             message:
               type: string
       400:
-        description: 댓글 내용이 누락된 경우
+        description: 댓글 내용이 누락되었거나 답글 깊이 제한을 넘은 경우
       404:
-        description: 게시글을 찾을 수 없음
+        description: 게시글 또는 부모 댓글을 찾을 수 없음
+      409:
+        description: 같은 Idempotency-Key 요청이 아직 처리 중
+      429:
+        description: 요청 한도 초과 (Retry-After 헤더 참고)
+      422:
+        description: 같은 Idempotency-Key로 다른 내용을 보낸 경우
+      500:
+        description: 댓글 저장 실패 (그룹 커밋 모드)
+      503:
+        description: 그룹 커밋 대기 시간 초과 (Idempotency-Key로 재시도하면 최종 결과를 받음)
     """
     user_id = int(get_jwt_identity())
     content = request.json.get("content")
@@ -59,7 +92,40 @@ def create_comment(post_id):
     if not post:
         return jsonify({"error": "게시글을 찾을 수 없습니다."}), 404
 
-    new_comment = Comment(post_id=post_id, user_id=user_id, content=content)
+    # ✅ 답글이면 부모 path 뒤에 새 세그먼트를 붙임
+    parent_id = request.json.get("parent_id")
+    path, depth = comment_path_segment(), 0
+    if parent_id is not None:
+        parent = Comment.query.get(parent_id)
+        if not parent or parent.post_id != post_id:
+            return jsonify({"error": "부모 댓글을 찾을 수 없습니다."}), 404
+        if parent.depth + 1 >= COMMENT_MAX_DEPTH:
+            return jsonify({"error": f"답글은 {COMMENT_MAX_DEPTH}단계까지만 작성할 수 있습니다."}), 400
+        path, depth = f"{parent.path}.{path}", parent.depth + 1
+
+    values = {"post_id": post_id, "user_id": user_id, "parent_id": parent_id, "path": path, "depth": depth, "content": content}
+
+    # ✅ 그룹 커밋 모드: 배치가 커밋된 뒤에 응답
+    writer = current_app.extensions.get("comment_writer")
+    if writer is not None:
+        # 대기하는 동안 조회에 쓴 DB 연결을 반납 (쥐고 있으면 커밋 스레드가 연결을 얻지 못함)
+        db.session.close()
+        error = None
+        try:
+            writer.submit(**values)
+        except CommitTimeout as e:
+            # 아직 커밋되지 않았으므로 성공으로 응답하지 않음
+            # Idempotency-Key가 있으면 키를 처리 중으로 유지하고, 최종 결과를 기록해 재시도 시 그대로 재생
+            resolve = defer_idempotent_result()
+            if resolve is not None:
+                e.pending.add_done_callback(lambda commit_error: resolve(*_comment_result(commit_error)))
+            return jsonify({"error": "댓글 저장이 지연되고 있습니다. 잠시 후 다시 시도하세요."}), 503, {"Retry-After": "1"}
+        except Exception as e:
+            error = e
+        status, body = _comment_result(error)
+        return jsonify(body), status
+
+    new_comment = Comment(**values)
     db.session.add(new_comment)
     db.session.commit()
 
@@ -69,7 +135,9 @@ def create_comment(post_id):
 @comments.route("/post/<int:post_id>/comments", methods=["GET"])
 def get_comments(post_id):
     """
-    특정 게시물의 댓글 조회
+    특정 게시물의 댓글 조회 (스레드 순서)
+    root를 지정하면 해당 댓글의 하위 스레드만, max_depth / limit / after로 부분 조회할 수 있습니다.
+    모든 경우 (post_id, path) 인덱스 범위 조회 한 번으로 가져옵니다.
     ---
     tags:
       - Comments
@@ -79,6 +147,26 @@ def get_comments(post_id):
         type: integer
         required: true
         description: 조회할 게시물의 ID
+      - in: query
+        name: root
+        type: integer
+        required: false
+        description: 이 댓글과 그 하위 답글만 조회
+      - in: query
+        name: max_depth
+        type: integer
+        required: false
+        description: 조회 기준(최상위 또는 root)으로부터 최대 깊이 (0이면 기준 댓글만)
+      - in: query
+        name: limit
+        type: integer
+        required: false
+        description: 최대 댓글 수 (최대 500)
+      - in: query
+        name: after
+        type: string
+        required: false
+        description: 이전 페이지 마지막 댓글의 path (다음 페이지 조회용 커서)
     responses:
       200:
         description: 댓글 목록 조회 성공
@@ -96,20 +184,54 @@ def get_comments(post_id):
               created_at:
                 type: string
                 description: 댓글 작성 시간 (YYYY-MM-DD HH:MM:SS)
+              parent_id:
+                type: integer
+              depth:
+                type: integer
+              path:
+                type: string
       404:
-        description: 게시글을 찾을 수 없음
+        description: 게시글 또는 root 댓글을 찾을 수 없음
     """
     post = Post.query.get(post_id)
     if not post:
         return jsonify({"error": "게시글을 찾을 수 없습니다."}), 404
 
-    comments = Comment.query.filter_by(post_id=post_id).all()
+    query = Comment.query.options(joinedload(Comment.user)).filter(Comment.post_id == post_id)
+
+    # ✅ 하위 스레드: root path로 시작하는 범위 [path, path + "/")
+    base_depth = 0
+    root_id = request.args.get("root", type=int)
+    if root_id is not None:
+        root = Comment.query.get(root_id)
+        if not root or root.post_id != post_id:
+            return jsonify({"error": "댓글을 찾을 수 없습니다."}), 404
+        base_depth = root.depth
+        query = query.filter(Comment.path >= root.path, Comment.path < comment_subtree_end(root.path))
+
+    max_depth = request.args.get("max_depth", type=int)
+    if max_depth is not None:
+        query = query.filter(Comment.depth <= base_depth + max_depth)
+
+    after = request.args.get("after")
+    if after:
+        query = query.filter(Comment.path > after)
+
+    query = query.order_by(Comment.path)
+    limit = request.args.get("limit", type=int)
+    if limit is not None:
+        query = query.limit(min(max(limit, 1), 500))
+
+    comments = query.all()
     return jsonify([
         {
             "id": c.id,
             "content": c.content,
             "author": c.user.name,
-            "created_at": c.created_at.strftime("%Y-%m-%d %H:%M:%S")
+            "created_at": c.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            "parent_id": c.parent_id,
+            "depth": c.depth,
+            "path": c.path,
         }
         for c in comments
     ])
@@ -119,7 +241,7 @@ def get_comments(post_id):
 @jwt_required()
 def delete_comment(comment_id):
     """
-    댓글 삭제 (본인만 가능)
+    댓글 삭제 (본인만 가능, 하위 답글도 함께 삭제)
     ---
     tags:
       - Comments
@@ -153,7 +275,12 @@ def delete_comment(comment_id):
     if comment.user_id != user_id:
         return jsonify({"error": "댓글 삭제 권한이 없습니다."}), 403
 
-    db.session.delete(comment)
+    # ✅ 하위 트리 전체를 path 범위 DELETE 한 번으로 삭제
+    Comment.query.filter(
+        Comment.post_id == comment.post_id,
+        Comment.path >= comment.path,
+        Comment.path < comment_subtree_end(comment.path),
+    ).delete(synchronize_session=False)
     db.session.commit()
 
     return jsonify({"message": "댓글이 삭제되었습니다!"})
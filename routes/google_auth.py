@@ -4,11 +4,14 @@ import datetime
 from flask import Blueprint, redirect, request, jsonify
 from flask_jwt_extended import create_access_token
 from models import db, User
+from circuit_breaker import get_breaker
+from rate_limit import rate_limited
 from flask import Response
 import json
 from flask_cors import cross_origin
 
 google_auth = Blueprint("google_auth", __name__)
+google_breaker = get_breaker("google")  # ✅ 제공자별 타임아웃 / 서킷 브레이커
 
 # 구글 OAuth 설정
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
@@ -43,6 +46,7 @@ def login_google():
 
 @google_auth.route("/login/google/callback")
 @cross_origin()
+@rate_limited
 def google_callback():
     """
     구글 로그인 콜백 엔드포인트
@@ -71,12 +75,12 @@ def google_callback():
         "redirect_uri": GOOGLE_REDIRECT_URI,
         "grant_type": "authorization_code",
     }
-    response = requests.post(GOOGLE_TOKEN_URL, data=token_data)
+    response = google_breaker.post(GOOGLE_TOKEN_URL, data=token_data)
     token_json = response.json()
     access_token = token_json.get("access_token")
 
     headers = {"Authorization": f"Bearer {access_token}"}
-    user_response = requests.get(GOOGLE_USER_INFO_URL, headers=headers)
+    user_response = google_breaker.get(GOOGLE_USER_INFO_URL, headers=headers)
     user_info = user_response.json()
 
     with db.session.begin():
@@ -4,6 +4,8 @@ import datetime
 from flask import Blueprint, redirect, request, jsonify
 from flask_jwt_extended import create_access_token
 from models import db, User
+from circuit_breaker import get_breaker
+from rate_limit import rate_limited
 from flask import Response
 import json
 from flask_cors import cross_origin
@@ -11,6 +13,7 @@ import uuid
 
 # 🔹 Flask Blueprint 설정
 kakao_auth = Blueprint("kakao_auth", __name__)
+kakao_breaker = get_breaker("kakao")  # ✅ 제공자별 타임아웃 / 서킷 브레이커
 
 # ✅ Kakao OAuth 설정
 KAKAO_CLIENT_ID = os.getenv("KAKAO_CLIENT_ID")
@@ -47,6 +50,7 @@ def login_kakao():
 
 @kakao_auth.route("/login/kakao/callback")
 @cross_origin()
+@rate_limited
 def kakao_callback():
     """
     카카오 로그인 콜백 엔드포인트
@@ -76,7 +80,7 @@ def kakao_callback():
         "redirect_uri": KAKAO_REDIRECT_URI,
         "code": code,
     }
-    response = requests.post(KAKAO_TOKEN_URL, data=token_data)
+    response = kakao_breaker.post(KAKAO_TOKEN_URL, data=token_data)
     token_json = response.json()
 
     if "access_token" not in token_json:
@@ -84,7 +88,7 @@ def kakao_callback():
 
     access_token = token_json["access_token"]
     headers = {"Authorization": f"Bearer {access_token}"}
-    user_response = requests.get(KAKAO_USER_URL, headers=headers)
+    user_response = kakao_breaker.get(KAKAO_USER_URL, headers=headers)
     user_info = user_response.json()
 
     print("🔹 카카오 사용자 정보 응답:", user_info)
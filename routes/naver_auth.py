@@ -4,10 +4,13 @@ import requests
 from flask import Blueprint, redirect, request, jsonify, session
 from flask_jwt_extended import create_access_token
 from models import db, User
+from circuit_breaker import get_breaker
+from rate_limit import rate_limited
 from flask_cors import cross_origin
 import urllib.parse
 
 naver_auth = Blueprint("naver_auth", __name__)
+naver_breaker = get_breaker("naver")  # ✅ 제공자별 타임아웃 / 서킷 브레이커
 
 # ✅ 환경변수에서 네이버 OAuth 정보 불러오기
 NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")
@@ -51,6 +54,7 @@ def login_naver():
 # ✅ 네이버 로그인 콜백
 @naver_auth.route("/login/naver/callback")
 @cross_origin()
+@rate_limited
 def naver_callback():
     """
     네이버 로그인 후 JWT 발급
@@ -89,7 +93,7 @@ def naver_callback():
         "code": code,
         "state": state,
     }
-    response = requests.post(NAVER_TOKEN_URL, data=token_data)
+    response = naver_breaker.post(NAVER_TOKEN_URL, data=token_data)
     token_json = response.json()
 
     if "access_token" not in token_json:
@@ -99,7 +103,7 @@ def naver_callback():
 
     # ✅ access_token을 사용하여 사용자 정보 요청
     headers = {"Authorization": f"Bearer {access_token}"}
-    user_response = requests.get(NAVER_USER_URL, headers=headers)
+    user_response = naver_breaker.get(NAVER_USER_URL, headers=headers)
     user_info = user_response.json().get("response", {})
 
     if not user_info:
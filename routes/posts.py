@@ -1,8 +1,12 @@
 import os
 import datetime
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models import db, Post, User
+from latest_feed import post_summary
+from idempotency import idempotent
+from rate_limit import rate_limited
+from sqlalchemy.orm import joinedload
 from werkzeug.utils import secure_filename
 from supabase import create_client, Client
 
@@ -19,6 +23,8 @@ supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
 # ✅ 게시글 작성 API (이미지 업로드 포함)
 @posts.route("/post", methods=["POST"])
 @jwt_required()
+@rate_limited
+@idempotent("create_post")
 def create_post():
     """
     JWT 기반 인증 후 게시글 작성 (이미지 포함)
@@ -45,6 +51,11 @@ def create_post():
         type: file
         required: false
         description: 업로드할 이미지 파일
+      - in: header
+        name: Idempotency-Key
+        type: string
+        required: false
+        description: 재시도 시 같은 값을 보내면 중복 생성 없이 처음 응답을 그대로 반환
     responses:
       200:
         description: 게시글 생성 성공
@@ -57,6 +68,12 @@ def create_post():
               type: string
       400:
         description: 제목과 내용을 입력하지 않은 경우 등 요청 오류
+      409:
+        description: 같은 Idempotency-Key 요청이 아직 처리 중
+      429:
+        description: 요청 한도 초과 (Retry-After 헤더 참고)
+      422:
+        description: 같은 Idempotency-Key로 다른 내용을 보낸 경우
       500:
         description: 이미지 업로드 실패
     """
@@ -86,6 +103,7 @@ def create_post():
     new_post = Post(title=title, content=content, image_url=image_url, user_id=user_id)
     db.session.add(new_post)
     db.session.commit()
+    current_app.extensions["latest_feed"].add(new_post)
 
     return jsonify({"message": "게시글이 생성되었습니다!", "image_url": image_url})
 
@@ -95,9 +113,21 @@ def create_post():
 def get_posts():
     """
     모든 게시글 조회
+    page를 지정하면 최신순으로 페이지 단위 조회 (첫 페이지는 메모리 캐시에서 응답)
     ---
     tags:
       - Posts
+    parameters:
+      - name: page
+        in: query
+        type: integer
+        required: false
+        description: 페이지 번호 (1부터, 생략 시 전체 조회)
+      - name: per_page
+        in: query
+        type: integer
+        required: false
+        description: 페이지당 게시글 수 (기본 20, 최대 100)
     responses:
       200:
         description: 게시글 목록 조회 성공
@@ -118,12 +148,71 @@ def get_posts():
                 type: string
               author:
                 type: string
+              view_count:
+                type: integer
     """
-    posts = Post.query.all()
-    return jsonify([
-        {"id": p.id, "title": p.title, "content": p.content, "image_url": p.image_url, "created_at": p.created_at, "author": p.user.name}
-        for p in posts
-    ])
+    page = request.args.get("page", type=int)
+    if page is None:
+        posts = Post.query.all()
+        return jsonify([
+            {"id": p.id, "title": p.title, "content": p.content, "image_url": p.image_url, "created_at": p.created_at, "author": p.user.name, "view_count": p.view_count}
+            for p in posts
+        ])
+
+    page = max(page, 1)
+    per_page = min(max(request.args.get("per_page", 20, type=int), 1), 100)
+
+    # ✅ 첫 페이지는 워커 메모리의 최신 게시글 버퍼에서 바로 응답
+    if page == 1:
+        response = current_app.extensions["latest_feed"].page_response(per_page)
+        if response is not None:
+            return response
+
+    posts = (
+        Post.query.options(joinedload(Post.user))
+        .order_by(Post.id.desc())
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+        .all()
+    )
+    return jsonify([post_summary(p) for p in posts])
+
+
+# ✅ 인기 게시글 조회 API
+@posts.route("/posts/hot", methods=["GET"])
+def get_hot_posts():
+    """
+    인기 게시글 조회 (조회수 + 댓글수 기반 시간 감쇠 점수)
+    주기적으로 미리 계산된 순위를 반환합니다.
+    ---
+    tags:
+      - Posts
+    responses:
+      200:
+        description: 인기 게시글 목록 (점수 내림차순)
+        schema:
+          type: array
+          items:
+            type: object
+            properties:
+              id:
+                type: integer
+              title:
+                type: string
+              image_url:
+                type: string
+              created_at:
+                type: string
+              author:
+                type: string
+              view_count:
+                type: integer
+              comment_count:
+                type: integer
+              score:
+                type: number
+    """
+    return current_app.extensions["post_stats"].hot_response()
 
 
 
@@ -159,6 +248,8 @@ def get_post(post_id):
               type: string
             author:
               type: string
+            view_count:
+              type: integer
       404:
         description: 게시글을 찾을 수 없음
     """
@@ -167,6 +258,9 @@ def get_post(post_id):
     if not post:
         return jsonify({"error": "게시글을 찾을 수 없습니다."}), 404
 
+    # ✅ 조회수는 메모리에 모았다가 주기적으로 DB에 반영
+    current_app.extensions["post_stats"].record_view(post_id)
+
     author_name = post.user.name if post.user else "Unknown"
 
     return jsonify({
@@ -175,7 +269,8 @@ def get_post(post_id):
         "content": post.content,
         "image_url": post.image_url,
         "created_at": post.created_at,
-        "author": author_name
+        "author": author_name,
+        "view_count": post.view_count
     })
 
 
@@ -221,5 +316,6 @@ def delete_post(post_id):
 
     db.session.delete(post)
     db.session.commit()
+    current_app.extensions["latest_feed"].remove(post_id)
 
     return jsonify({"message": "게시글이 삭제되었습니다."})
@@ -0,0 +1,154 @@
+import io
+import csv
+import time
+import random
+import datetime
+from array import array
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import func, insert, text
+from models import db, User, Post, Comment, comment_path_segment
+
+
+PROVIDERS = ["kakao", "naver", "google"]
+WORDS = [
+    "바나나", "커뮤니티", "오늘", "점심", "추천", "질문", "후기", "공유", "사진", "여행",
+    "맛집", "개발", "flask", "python", "supabase", "주말", "운동", "음악", "영화", "책",
+]
+
+
+def skewed_pick(first_id, count, skew):
+    """first_id ~ first_id+count-1 중 하나 선택 (skew가 클수록 앞쪽 id에 몰림, 0이면 균등)"""
+    return first_id + int(count * random.random() ** (1 + skew))
+
+
+def sentence(min_words, max_words):
+    return " ".join(random.choices(WORDS, k=random.randint(min_words, max_words)))
+
+
+def seconds_ago(now, seconds):
+    return now - datetime.timedelta(seconds=seconds)
+
+
+class BulkWriter:
+    """Postgres는 COPY, 그 외 DB는 다중 행 INSERT(executemany)로 배치 저장"""
+
+    def __init__(self):
+        self.is_postgres = db.engine.dialect.name == "postgresql"
+
+    def write(self, model, columns, rows):
+        table = model.__table__
+        if self.is_postgres:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(rows)
+            buffer.seek(0)
+            table_name = db.engine.dialect.identifier_preparer.format_table(table)
+            raw = db.engine.raw_connection()
+            try:
+                with raw.cursor() as cursor:
+                    cursor.copy_expert(f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+                raw.commit()
+            finally:
+                raw.close()
+        else:
+            db.session.execute(insert(table), [dict(zip(columns, row)) for row in rows])
+            db.session.commit()
+
+    def reset_sequence(self, model):
+        # id를 직접 지정해 넣었으므로 Postgres 시퀀스를 최대 id로 맞춤
+        if not self.is_postgres:
+            return
+        table_name = model.__table__.name
+        db.session.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('\"{table_name}\"', 'id'), (SELECT MAX(id) FROM \"{table_name}\"))"
+        ))
+        db.session.commit()
+
+
+def seed_table(writer, model, columns, total, batch_size, make_row):
+    """batch_size 단위로 행을 만들어 저장 (메모리 사용량은 배치 크기로 제한)"""
+    start = time.perf_counter()
+    done = 0
+    while done < total:
+        size = min(batch_size, total - done)
+        writer.write(model, columns, [make_row(done + i) for i in range(size)])
+        done += size
+        elapsed = time.perf_counter() - start
+        click.echo(f"\r  {model.__tablename__}: {done}/{total} ({done / elapsed:,.0f} rows/s)", nl=False)
+    writer.reset_sequence(model)
+    elapsed = time.perf_counter() - start
+    click.echo(f"\r✅ {model.__tablename__}: {total}건 {elapsed:.1f}s ({total / max(elapsed, 1e-9):,.0f} rows/s)")
+
+
+@click.command("seed")
+@click.option("--users", default=10000, show_default=True, help="생성할 사용자 수")
+@click.option("--posts", default=100000, show_default=True, help="생성할 게시글 수")
+@click.option("--comments", default=1000000, show_default=True, help="생성할 댓글 수")
+@click.option("--skew", default=1.0, show_default=True, help="작성자/인기 게시글 쏠림 정도 (0이면 균등)")
+@click.option("--days", default=90, show_default=True, help="작성 시간 분포 기간(일)")
+@click.option("--batch-size", default=5000, show_default=True, help="배치당 행 수")
+@click.option("--random-seed", default=None, type=int, help="재현용 난수 시드")
+@with_appcontext
+def seed_command(users, posts, comments, skew, days, batch_size, random_seed):
+    """부하 테스트용 사용자 / 게시글 / 댓글 대량 생성"""
+    if random_seed is not None:
+        random.seed(random_seed)
+
+    writer = BulkWriter()
+    now = datetime.datetime.utcnow()
+    click.echo(f"🚀 시드 데이터 생성 ({db.engine.dialect.name}, {'COPY' if writer.is_postgres else 'multi-row INSERT'})")
+
+    # 기존 데이터 뒤에 이어서 id를 직접 부여 (RETURNING 없이 외래키 연결)
+    first_user = (db.session.query(func.max(User.id)).scalar() or 0) + 1
+    first_post = (db.session.query(func.max(Post.id)).scalar() or 0) + 1
+    first_comment = (db.session.query(func.max(Comment.id)).scalar() or 0) + 1
+    run_tag = f"{int(now.timestamp())}"
+
+    def user_row(i):
+        user_id = first_user + i
+        provider = random.choice(PROVIDERS)
+        return (user_id, provider, f"seed-{run_tag}-{user_id}", f"사용자{user_id}", f"seed{run_tag}_{user_id}@{provider}.seed")
+
+    seed_table(writer, User, ["id", "provider", "social_id", "name", "email"], users, batch_size, user_row)
+
+    if users == 0:
+        return
+
+    # 게시글별 작성 시점(now 기준 경과 초, 게시글당 4바이트) → 댓글 시간을 게시글 이후로 맞추는 데 사용
+    post_ages = array("I")
+
+    def post_row(i):
+        age = random.randint(0, days * 86400)
+        post_ages.append(age)
+        image_url = f"https://example.supabase.co/storage/v1/object/public/seed/{first_post + i}.png" if random.random() < 0.3 else None
+        return (
+            first_post + i,
+            sentence(2, 8),
+            sentence(10, 80),
+            skewed_pick(first_user, users, skew),
+            image_url,
+            seconds_ago(now, age),
+            int(1000 * random.random() ** (1 + 4 * skew)),
+        )
+
+    seed_table(writer, Post, ["id", "title", "content", "user_id", "image_url", "created_at", "view_count"],
+               posts, batch_size, post_row)
+
+    if posts == 0:
+        return
+
+    def comment_row(i):
+        post_id = skewed_pick(first_post, posts, skew)
+        created_at = seconds_ago(now, random.randint(0, post_ages[post_id - first_post]))
+        return (
+            first_comment + i,
+            post_id,
+            skewed_pick(first_user, users, skew),
+            sentence(1, 20),
+            created_at,
+            comment_path_segment(created_at),
+            0,
+        )
+
+    seed_table(writer, Comment, ["id", "post_id", "user_id", "content", "created_at", "path", "depth"],
+               comments, batch_size, comment_row)
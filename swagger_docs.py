@@ -0,0 +1,66 @@
+import os
+import json
+import threading
+import click
+from flask import Response, current_app
+from flask.cli import with_appcontext
+
+
+def init_swagger(app, template):
+    """
+    Swagger 문서 설정
+    - SWAGGER_ENABLED=False 이면 flasgger를 import 하지 않음 (운영 환경 시작 시간 단축)
+    - SWAGGER_SPEC_PATH 파일이 있으면 docstring 파싱 없이 그 파일을 /apispec_1.json 으로 제공
+    - 파일이 없으면 첫 요청 때 한 번만 생성 / 직렬화하여 캐시
+    """
+    spec_path = app.config.get("SWAGGER_SPEC_PATH")
+    has_spec_file = bool(spec_path) and os.path.exists(spec_path)
+    swagger = None
+
+    if app.config.get("SWAGGER_ENABLED", True):
+        from flasgger import Swagger
+        swagger = Swagger(app, template=template)
+    elif not has_spec_file:
+        return None
+
+    cache = {}
+    lock = threading.Lock()
+
+    def spec_body():
+        if "body" not in cache:
+            with lock:
+                if "body" not in cache:
+                    if has_spec_file:
+                        with open(spec_path, "rb") as f:
+                            cache["body"] = f.read()
+                    else:
+                        cache["body"] = json.dumps(swagger.get_apispecs(), ensure_ascii=False).encode()
+        return cache["body"]
+
+    def serve_spec():
+        return Response(spec_body(), mimetype="application/json")
+
+    if swagger is not None:
+        # flasgger 기본 뷰는 매 요청마다 스펙 dict를 다시 jsonify 하므로 캐시된 본문으로 교체
+        app.view_functions["flasgger.apispec_1"] = serve_spec
+    else:
+        app.add_url_rule("/apispec_1.json", "apispec_1", serve_spec)
+
+    app.cli.add_command(swagger_spec_command)
+    return swagger
+
+
+@click.command("swagger-spec")
+@click.option("--output", default="apispec.json", show_default=True, help="저장할 스펙 파일 경로")
+@with_appcontext
+def swagger_spec_command(output):
+    """route docstring에서 Swagger 스펙을 생성하여 파일로 저장 (빌드 시 1회 실행)"""
+    swagger = getattr(current_app, "swag", None)
+    if swagger is None:
+        raise click.ClickException("SWAGGER_ENABLED=1 상태에서 실행해야 합니다.")
+
+    with current_app.test_request_context():
+        spec = swagger.get_apispecs()
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(spec, f, ensure_ascii=False)
+    click.echo(f"✅ Swagger 스펙 저장 완료: {output}")
@@ -0,0 +1,125 @@
+import time
+import tempfile
+import threading
+import pytest
+import cachelib.file
+import cachelib.simple
+from flask import Flask, jsonify
+from flask_jwt_extended import JWTManager, create_access_token, jwt_required
+from idempotency import init_idempotency, idempotent, defer_idempotent_result
+
+
+class FakeClock:
+    """cachelib 만료 판정에 쓰이는 time()을 대신해 시간을 앞으로 돌릴 수 있게 함"""
+
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(params=["memory", "filesystem"])
+def client(request, tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    clock = FakeClock()
+    monkeypatch.setattr(cachelib.simple, "time", clock)
+    monkeypatch.setattr(cachelib.file, "time", clock)
+
+    app = Flask(__name__)
+    app.config["JWT_SECRET_KEY"] = "test-secret-key-with-at-least-32-bytes"
+    app.config["IDEMPOTENCY_BACKEND"] = request.param
+    app.config["IDEMPOTENCY_TTL"] = 1
+    JWTManager(app)
+    init_idempotency(app)
+
+    calls = []
+
+    @app.route("/items", methods=["POST"])
+    @jwt_required()
+    @idempotent("items")
+    def create_item():
+        calls.append(1)
+        return jsonify({"n": len(calls)}), 201
+
+    resolvers = []
+
+    @app.route("/deferred", methods=["POST"])
+    @jwt_required()
+    @idempotent("deferred")
+    def create_deferred():
+        # 결과가 응답 이후에 확정되는 경우 (그룹 커밋 대기 시간 초과와 같은 상황)
+        calls.append(1)
+        resolvers.append(defer_idempotent_result())
+        return jsonify({"error": "지연"}), 503
+
+    with app.app_context():
+        token = create_access_token(identity="1")
+    test_client = app.test_client()
+    test_client.clock = clock
+    test_client.calls = calls
+    test_client.resolvers = resolvers
+    test_client.headers = {"Authorization": f"Bearer {token}", "Idempotency-Key": "k1"}
+    return test_client
+
+
+def post_with_deadline(client, timeout=5):
+    """되풀이 claim으로 멈추는 회귀가 있으면 테스트가 끝나지 않는 대신 실패하도록 별도 스레드에서 요청"""
+    result = {}
+    worker = threading.Thread(daemon=True, target=lambda: result.update(
+        response=client.post("/items", json={"a": 1}, headers=client.headers)
+    ))
+    worker.start()
+    worker.join(timeout=timeout)
+    assert not worker.is_alive(), "같은 Idempotency-Key 요청이 끝나지 않음"
+    return result["response"]
+
+
+def test_replays_within_ttl(client):
+    first = client.post("/items", json={"a": 1}, headers=client.headers)
+    second = client.post("/items", json={"a": 1}, headers=client.headers)
+    assert first.status_code == second.status_code == 201
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert second.get_json() == first.get_json()
+    assert len(client.calls) == 1
+
+
+def test_key_reused_after_ttl_is_processed_again(client):
+    assert client.post("/items", json={"a": 1}, headers=client.headers).status_code == 201
+    client.clock.now += 5  # 저장된 결과가 만료되었지만 항목은 아직 남아 있는 상태
+
+    response = post_with_deadline(client)
+    assert response.status_code == 201
+    assert "Idempotent-Replayed" not in response.headers
+    assert len(client.calls) == 2
+
+
+def test_expired_pending_marker_can_be_reclaimed(client):
+    store = client.application.extensions["idempotency"]
+    assert store.claim("items:1:k1", "other")  # 처리 도중 워커가 죽어 남은 처리 중 표시
+    client.clock.now += store.lock_ttl + 5
+
+    response = post_with_deadline(client)
+    assert response.status_code == 201
+    assert len(client.calls) == 1
+
+
+def test_deferred_result_is_replayed_not_the_provisional_response(client):
+    assert client.post("/deferred", json={"a": 1}, headers=client.headers).status_code == 503
+    store = client.application.extensions["idempotency"]
+    store.wait_timeout = 0.1
+    # 결과가 확정되기 전 재시도는 처리 중으로 응답 (다시 처리하지 않음)
+    assert client.post("/deferred", json={"a": 1}, headers=client.headers).status_code == 409
+
+    client.resolvers[0](200, {"message": "ok"})
+    replayed = client.post("/deferred", json={"a": 1}, headers=client.headers)
+    assert replayed.status_code == 200
+    assert replayed.get_json() == {"message": "ok"}
+    assert len(client.calls) == 1
+
+
+def test_deferred_failure_releases_key(client):
+    assert client.post("/deferred", json={"a": 1}, headers=client.headers).status_code == 503
+    client.resolvers[0](500, {"error": "실패"})
+    assert client.post("/deferred", json={"a": 1}, headers=client.headers).status_code == 503
+    assert len(client.calls) == 2